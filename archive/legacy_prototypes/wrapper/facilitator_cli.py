@@ -31,14 +31,21 @@ def main(
         # Bind to localhost only
         actcli-facilitator --host 127.0.0.1
     """
+    # Subcommands (and --help, handled by click) never need the server stack
+    if ctx.invoked_subcommand:
+        return
+
     import uvicorn
     from ..facilitator.service import create_app
 
-    typer.echo(f"🚀 Starting AI Facilitator Service")
-    typer.echo(f"   Host: {host}")
-    typer.echo(f"   Port: {port}")
-    typer.echo(f"   Docs: http://{host if host != '0.0.0.0' else 'localhost'}:{port}/docs")
-    typer.echo(f"\n✨ Ready to facilitate AI conversations!\n")
+    docs_host = host if host != "0.0.0.0" else "localhost"
+    typer.echo(
+        f"🚀 Starting AI Facilitator Service\n"
+        f"   Host: {host}\n"
+        f"   Port: {port}\n"
+        f"   Docs: http://{docs_host}:{port}/docs\n"
+        f"\n✨ Ready to facilitate AI conversations!\n"
+    )
 
     app = create_app()
     uvicorn.run(app, host=host, port=port)
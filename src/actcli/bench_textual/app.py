@@ -44,6 +44,10 @@ from .tree_sections import TerminalsSection, SessionsSection, SettingsSection, L
 from ..shell import ActCLIShell, NavigationTree
 
 
+# Window-drag resize events arriving within one frame collapse into one sync
+RESIZE_DEBOUNCE_SECONDS = 0.016
+
+
 @dataclass
 class TerminalItem:
     name: str
@@ -57,6 +61,8 @@ class BenchTextualApp(ActCLIShell):
 
     CSS_PATH = "../shell/themes.tcss"
     DEFAULT_THEME = "ledger"
+    BRAND_TEXT = "ActCLI • Bench"
+    INITIAL_STATUS = "Terminal"
 
     BINDINGS = [
         *ActCLIShell.BINDINGS,
@@ -102,18 +108,18 @@ class BenchTextualApp(ActCLIShell):
         self._session_id: Optional[str] = None
         self._writer_attached: bool = False
         self._border_blink_timer: Optional[Timer] = None
+        # Debounced resize state: terminals awaiting a sync, the frame timer
+        # that will run it, and each terminal's pending late-layout re-syncs
+        self._pending_resizes: set[str] = set()
+        self._resize_flush_timer: Optional[Timer] = None
+        self._resize_followups: Dict[str, List[Timer]] = {}
+        # Set while a render of the active terminal's output is queued, so a
+        # burst of output callbacks collapses into one view update
+        self._output_render_pending: bool = False
 
         # Scrollback UI state (managed separately from TerminalManager)
         self.scroll_offsets: Dict[str, int] = {}
 
-    def get_brand_text(self) -> str:
-        """Override to provide Bench branding."""
-        return "ActCLI • Bench"
-
-    def get_initial_status(self) -> str:
-        """Override to provide Bench initial status."""
-        return "Terminal"
-
     async def on_mount(self) -> None:
         """Override to set up Bench-specific initialization."""
         # Call parent mount (which adds default theme and builds nav tree)
@@ -143,6 +149,10 @@ class BenchTextualApp(ActCLIShell):
         # Set up terminal view focus callback to refresh cursor display
         self.terminal_view.set_on_focus(self._on_terminal_view_focused)
 
+    def on_unmount(self) -> None:
+        """Close the terminals and stop the manager's output threads."""
+        self.terminal_manager.shutdown()
+
     def compose(self) -> ComposeResult:
         """Compose the Bench UI using the shell layout."""
         # Use parent shell layout (sidebar + detail view)
@@ -204,9 +214,7 @@ class BenchTextualApp(ActCLIShell):
     def on_resize(self, event) -> None:  # type: ignore[override]
         try:
             if self.active_view == "terminal" and self.active_terminal:
-                name = self.active_terminal
-                self._sync_terminal_size(name)
-                self._schedule_terminal_resizes(name)
+                self._request_terminal_resize(self.active_terminal)
         except Exception:
             pass
 
@@ -439,22 +447,47 @@ class BenchTextualApp(ActCLIShell):
         self.terminal_manager.sync_terminal_size(name, cols, rows)
 
     def _schedule_terminal_resizes(self, name: str) -> None:
-        """Schedule delayed syncs to catch late layout adjustments."""
+        """Schedule delayed syncs to catch late layout adjustments.
+
+        Re-scheduling replaces the terminal's outstanding re-syncs, so a
+        burst of resize events leaves only the last set of timers.
+        """
+        for timer in self._resize_followups.pop(name, ()):
+            timer.stop()
         delays = (0.05, 0.2, 0.5, 1.0)
         try:
             self.call_after_refresh(lambda n=name: self._sync_terminal_size(n))
         except Exception:
             pass
+        timers: List[Timer] = []
         for delay in delays:
             try:
-                self.set_timer(delay, lambda n=name: self._sync_terminal_size(n))
+                timers.append(self.set_timer(delay, lambda n=name: self._sync_terminal_size(n)))
             except Exception:
                 pass
+        self._resize_followups[name] = timers
+
+    def _request_terminal_resize(self, name: str) -> None:
+        """Queue a size sync for ``name``, coalescing events within a frame."""
+        self._pending_resizes.add(name)
+        if self._resize_flush_timer is None:
+            self._resize_flush_timer = self.set_timer(
+                RESIZE_DEBOUNCE_SECONDS, self._flush_terminal_resizes
+            )
+
+    def _flush_terminal_resizes(self) -> None:
+        """Sync every terminal queued by _request_terminal_resize once."""
+        self._resize_flush_timer = None
+        names = list(self._pending_resizes)
+        self._pending_resizes.clear()
+        for name in names:
+            self._sync_terminal_size(name)
+            self._schedule_terminal_resizes(name)
 
     def _on_terminal_view_size_change(self) -> None:
         """Handle terminal view size updates by syncing the active terminal."""
         if self.active_terminal:
-            self._schedule_terminal_resizes(self.active_terminal)
+            self._request_terminal_resize(self.active_terminal)
 
     def _resize_emulator_if_needed(self, emu: EmulatedTerminal) -> None:
         """Resize emulator to match terminal view content area."""
@@ -551,14 +584,29 @@ class BenchTextualApp(ActCLIShell):
         """Called when terminal output arrives - refresh view if needed.
 
         TerminalManager handles emulator feeding and logging, this just updates the UI.
+        Runs on the output worker; the render itself is queued on the UI loop
+        and covers all output that arrives before it runs.
         """
         # Refresh terminal view if this is the active terminal and we're in terminal view
         if self.active_terminal == name and self.active_view == "terminal":
-            state = self.terminal_manager.get_terminal_state(name)
-            if state and state.scroll_offset == 0:
-                # Only refresh if not scrolled away
-                # Show cursor when in terminal view and not scrolled away
-                self._set_terminal_text(state.emulator.text_with_cursor(show=self.terminal_view.has_focus))
+            if not self._output_render_pending:
+                self._output_render_pending = True
+                # call_later posts a message, so it is safe from the worker
+                if not self.call_later(self._render_terminal_output):
+                    self._output_render_pending = False
+
+    def _render_terminal_output(self) -> None:
+        """Render the active terminal once for every output batch queued so far."""
+        # Cleared first: output arriving during the render queues another one
+        self._output_render_pending = False
+        name = self.active_terminal
+        if name is None or self.active_view != "terminal":
+            return
+        state = self.terminal_manager.get_terminal_state(name)
+        if state and state.scroll_offset == 0:
+            # Only refresh if not scrolled away
+            # Show cursor when in terminal view and not scrolled away
+            self._set_terminal_text(state.emulator.text_with_cursor(show=self.terminal_view.has_focus))
 
     def _is_control_sequence(self, s: str) -> bool:
         t = s.strip()
@@ -622,11 +670,12 @@ class BenchTextualApp(ActCLIShell):
     def _handle_broadcast(self, text: str) -> None:
         """Broadcast a line to all unmuted terminals; optionally mirror to viewer."""
         self.last_broadcast = text
-        # Inject into each unmuted terminal
+        # Inject into each unmuted terminal, encoding the payload only once
+        payload = text.encode()
         for name in self.terminal_manager.list_terminals():
             state = self.terminal_manager.get_terminal_state(name)
             if state and not state.item.muted:
-                state.item.write(text)
+                state.item.write_bytes(payload)
         # Mirror to facilitator feed if enabled
         if self.chk_mirror.value and self.facilitator_client and self.session_manager.session:
             import asyncio
@@ -895,17 +944,12 @@ class BenchTextualApp(ActCLIShell):
         if not state:
             return
 
-        buf = state.scroll_buffer
         offset = self.scroll_offsets.get(name, 0)
-        if not buf:
-            return
-        # Show last screen worth with offset
-        lines = buf
+        # Show last screen worth with offset (cached by the manager)
         height = max(10, self.size.height - 6)
-        start = max(0, len(lines) - height - offset)
-        view = lines[start:start+height]
-        indicator = f"[SCROLLBACK offset={offset}]\n" if offset else ""
-        self._set_terminal_text(indicator + "\n".join(view))
+        text = self.terminal_manager.get_scrollback_text(name, offset=offset, height=height)
+        if text is not None:
+            self._set_terminal_text(text)
 
 
 def main() -> None:
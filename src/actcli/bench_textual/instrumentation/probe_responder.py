@@ -18,7 +18,8 @@ class TerminalProbeResponder:
         Args:
             text: The text being sent to the terminal (checked for probes).
             emulator: An EmulatedTerminal-like object with ``mode`` and
-                ``_screen.cursor`` attributes.
+                ``_screen.cursor`` attributes; ``flush_feed()`` is called
+                first when present.
 
         Returns:
             An escape-sequence response string, or ``None`` if no probe
@@ -30,6 +31,11 @@ class TerminalProbeResponder:
         if getattr(emulator, "mode", None) != "pyte":
             return None
 
+        # Batched output must reach the screen before the cursor is read
+        flush = getattr(emulator, "flush_feed", None)
+        if flush is not None:
+            flush()
+
         screen = getattr(emulator, "_screen", None)
         if screen is None:
             return None
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
@@ -64,7 +64,7 @@ class TroubleshootingPackBuilder:
             emu_size = f"{emu.cols}x{emu.rows}"
             last_sync = state.last_synced_size
             sync_str = f"{last_sync[0]}x{last_sync[1]}" if last_sync else "n/a"
-            tty_preview = state.output_buffer[-120:] if state.output_buffer else ""
+            tty_preview = state.output_buffer[-120:]
             runner = state.item
             first_preview = ""
             if hasattr(runner, "first_output_preview"):
@@ -81,7 +81,7 @@ class TroubleshootingPackBuilder:
             history = state.winsize_history
             if history:
                 lines.append("    winsize_history:")
-                for entry in history[-10:]:
+                for entry in list(history)[-10:]:
                     lines.append(f"      • {entry}")
 
             if tty_preview:
@@ -115,7 +115,8 @@ class TroubleshootingPackBuilder:
                 lines.append("\nRebuild events:")
                 for event in rebuild_history:
                     lines.append(
-                        f"  • {event['timestamp']} - [{event['section_count']} sections]"
+                        f"  • {self._format_timestamp(event['timestamp'])}"
+                        f" - [{event['section_count']} sections]"
                     )
 
         if self.include_trace:
@@ -137,6 +138,15 @@ class TroubleshootingPackBuilder:
         target_file.write_text(text, encoding="utf-8")
         return target_file
 
+    @staticmethod
+    def _format_timestamp(value: Any) -> str:
+        """Render an epoch-nanosecond timestamp as ISO 8601 UTC; pass others through."""
+        if isinstance(value, int):
+            seconds, nanos = divmod(value, 1_000_000_000)
+            moment = datetime.fromtimestamp(seconds, tz=timezone.utc)
+            return moment.replace(tzinfo=None, microsecond=nanos // 1000).isoformat() + "Z"
+        return str(value)
+
     def _recent_log_text(self, category: str, limit: int = 50) -> str:
         buf = self.log_manager.buffers.get(category, [])
         if not buf:
@@ -6,26 +6,27 @@ just accumulates plain text lines.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Callable
-import wcwidth
+from typing import Deque, Optional, Callable
 import re
+import threading
+
+import wcwidth
 
 
-# ANSI escape sequence pattern
-# Matches: ESC [ ... m (SGR), ESC ] ... (OSC), ESC [ ... (CSI), etc.
+# ANSI escape sequence pattern, shared with the terminal manager's scrollback
+# Matches: ESC ] ... (OSC), ESC P/X/^/_ ... ESC \\ (DCS/SOS/PM/APC),
+# ESC [ ... (CSI, any final byte), two-byte Fe escapes (ESC M, ESC D, ...)
+# and charset designators (ESC ( B). OSC and DCS-style strings come first
+# so their payloads are removed with them. Each alternative is a single
+# linear scan with no nested quantifiers, so the backtracking engine never
+# revisits input.
 _ANSI_ESCAPE_PATTERN = re.compile(
-    r'\x1b\['  # CSI sequences: ESC [
-    r'[0-9;]*'  # parameters
-    r'[a-zA-Z]'  # final byte
-    r'|'
-    r'\x1b\]'  # OSC sequences: ESC ]
-    r'[^\x07]*'  # data
-    r'(?:\x07|\x1b\\)'  # terminator: BEL or ESC \
-    r'|'
-    r'\x1b[PX^_]'  # Other escape sequences
-    r'[^\x1b]*'
-    r'\x1b\\'
+    r'\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)'  # OSC: ESC ] data (BEL | ESC \)
+    r'|\x1b[PX^_][^\x1b]*\x1b\\'  # DCS/SOS/PM/APC: ESC P data ESC \
+    r'|\x1b(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])'  # CSI and two-byte escapes
+    r'|\x1b[()][0-9;]*[A-Za-z0-9<>]'  # Charset designators: ESC ( B
 )
 
 
@@ -40,25 +41,42 @@ def _strip_ansi(text: str) -> str:
     return _ANSI_ESCAPE_PATTERN.sub('', text)
 
 
+def _preview(value, limit: int = 200) -> str:
+    """Debug preview of a str/bytes value, truncated before repr().
+
+    Slicing first keeps the cost proportional to ``limit`` rather than to
+    the full value, which matters for long lines logged on every frame.
+    """
+    return repr(value[:limit])
+
+
+# Text fed to pyte is held until the screen is read; past this many
+# characters it is parsed eagerly so a terminal that is never rendered
+# (a background tab) doesn't accumulate output without bound.
+FEED_BATCH_CHARS = 65536
+
+
 @dataclass
 class _NoopScreen:
     cols: int
     rows: int
-    _buffer: list[str]
+    _buffer: Deque[str]
 
     def __init__(self, cols: int, rows: int) -> None:
         self.cols = cols
         self.rows = rows
-        self._buffer = []
+        # Only the last `rows` lines are ever displayed; keep no more.
+        self._buffer = deque(maxlen=rows)
 
     def feed(self, data: str) -> None:
         self._buffer.extend(data.splitlines())
 
     def display_text(self) -> str:
-        lines = self._buffer[-self.rows :]
-        return "\n".join(line[: self.cols] for line in lines)
+        return "\n".join(line[: self.cols] for line in self._buffer)
 
     def resize(self, cols: int, rows: int) -> None:
+        if rows != self.rows:
+            self._buffer = deque(self._buffer, maxlen=rows)
         self.cols = cols
         self.rows = rows
 
@@ -75,66 +93,110 @@ class EmulatedTerminal:
         self._use_pyte = False
         self._pyte_version: Optional[str] = None
         self._debug_logger = debug_logger
+        # Output is fed from a worker thread while the UI renders and
+        # resizes; public methods hold this (re-entrant) lock.
+        self._lock = threading.RLock()
+        # Text chunks waiting to be parsed by pyte (see flush_feed)
+        self._pending: list[str] = []
+        self._pending_size = 0
         try:
             import pyte  # type: ignore
 
             # pyte.Screen(columns, lines) - note the order!
             self._screen = pyte.Screen(columns=cols, lines=rows)
             self._stream = pyte.ByteStream(self._screen)
+            # Text input (the runner delivers decoded output) gets its own
+            # str parser on the same screen instead of being re-encoded for
+            # the ByteStream. Each stream keeps its own parser state, so
+            # callers should not switch types in the middle of a sequence.
+            self._text_stream = pyte.Stream(self._screen)
             self._use_pyte = True
             self._pyte_version = getattr(pyte, "__version__", None)
         except Exception:
             self._screen = _NoopScreen(cols, rows)  # type: ignore
             self._stream = None
+            self._text_stream = None
+
+        # The backend never changes after construction, so pick the caret
+        # renderer once instead of re-testing _use_pyte on every frame.
+        self._render_with_cursor = (
+            self._pyte_text_with_cursor if self._use_pyte else self._plain_text_with_cursor
+        )
 
     def feed(self, data) -> None:
-        if self._use_pyte:
-            try:
-                if isinstance(data, str):
-                    b = data.encode("utf-8", errors="replace")
-                else:
-                    b = data
+        with self._lock:
+            log = self._debug_logger
+            if self._use_pyte:
+                try:
+                    # DEBUG: Log escape sequences to understand what we're receiving
+                    if log is not None and data:
+                        esc = "\x1b" if isinstance(data, str) else b"\x1b"
+                        if esc in data:
+                            preview = repr(data)  # FULL SEQUENCE - no truncation for investigation
+                            log(f"[feed] Received escape sequences: {preview}")
+
+                    if isinstance(data, str):
+                        # Batch text chunks and parse them in one pass when the
+                        # screen is next read; a single pyte feed per frame is
+                        # far cheaper than one per PTY read.
+                        self._pending.append(data)
+                        self._pending_size += len(data)
+                        if self._pending_size >= FEED_BATCH_CHARS:
+                            self.flush_feed()
+                    else:
+                        self.flush_feed()
+                        self._stream.feed(data)  # type: ignore[attr-defined]
+                except Exception:
+                    pass
+            else:
+                self._screen.feed(data)  # type: ignore
 
-                # DEBUG: Log escape sequences to understand what we're receiving
-                if self._debug_logger and b:
-                    # Log cursor positioning codes if present
-                    if b'\x1b[' in b or b'\x1bM' in b or b'\x1b' in b:
-                        # Truncate for readability
-                        preview = repr(b)  # FULL SEQUENCE - no truncation for investigation
-                        self._debug_logger(f"[feed] Received escape sequences: {preview}")
+    def flush_feed(self) -> None:
+        """Parse any batched text into the pyte screen.
 
-                self._stream.feed(b)  # type: ignore[attr-defined]
+        Called automatically before the screen is read or resized; callers
+        that inspect ``_screen`` directly (e.g. probe responders) should
+        call it first.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            data = "".join(self._pending)
+            self._pending.clear()
+            self._pending_size = 0
+            try:
+                self._text_stream.feed(data)  # type: ignore[union-attr]
             except Exception:
                 pass
-        else:
-            self._screen.feed(data)  # type: ignore
 
     def text(self) -> str:
-        if self._use_pyte:
-            try:
-                # pyte's Screen.display yields the visible lines
-                return "\n".join(self._screen.display)  # type: ignore[attr-defined]
-            except Exception:
-                return ""
-        else:
-            return self._screen.display_text()  # type: ignore
+        with self._lock:
+            self.flush_feed()
+            if self._use_pyte:
+                try:
+                    # pyte's Screen.display yields the visible lines
+                    return "\n".join(self._screen.display)  # type: ignore[attr-defined]
+                except Exception:
+                    return ""
+            else:
+                return self._screen.display_text()  # type: ignore
 
     def _index_from_column(self, line: str, column: int) -> int:
         """Return string index that corresponds to a visual column.
 
         Uses wcwidth to account for wide/combining characters.
         """
-        if self._debug_logger:
+        log = self._debug_logger
+        if log is not None:
             # Log raw line with escape codes visible
-            raw_repr = repr(line)
-            self._debug_logger(f"[_index_from_column] target_column={column}, line_len={len(line)}")
-            self._debug_logger(f"[_index_from_column] raw_line={raw_repr[:200]}")
+            log(f"[_index_from_column] target_column={column}, line_len={len(line)}")
+            log(f"[_index_from_column] raw_line={_preview(line)}")
 
             # Try stripping ANSI and compare
             stripped = _strip_ansi(line)
             if stripped != line:
-                self._debug_logger(f"[_index_from_column] ANSI detected! stripped_len={len(stripped)}, original_len={len(line)}")
-                self._debug_logger(f"[_index_from_column] stripped={repr(stripped[:100])}")
+                log(f"[_index_from_column] ANSI detected! stripped_len={len(stripped)}, original_len={len(line)}")
+                log(f"[_index_from_column] stripped={_preview(stripped, 100)}")
 
         if column <= 0:
             return 0
@@ -144,17 +206,18 @@ class EmulatedTerminal:
             if w < 0:
                 w = 0
             if width + w >= column:
-                if self._debug_logger:
-                    self._debug_logger(f"[_index_from_column] found at index={i+1}, char={repr(ch)}, accumulated_width={width}")
+                if log is not None:
+                    log(f"[_index_from_column] found at index={i+1}, char={repr(ch)}, accumulated_width={width}")
                 return i + 1
             width += w
 
-        if self._debug_logger:
-            self._debug_logger(f"[_index_from_column] reached end, returning len={len(line)}, accumulated_width={width}")
+        if log is not None:
+            log(f"[_index_from_column] reached end, returning len={len(line)}, accumulated_width={width}")
         return len(line)
 
     def _find_reverse_video_cursor(self, lines: list[str]) -> tuple[int, int]:
         """Return (line, column) of the last reverse-video cell, if any."""
+        log = self._debug_logger
 
         if not self._use_pyte:
             return (-1, -1)
@@ -174,9 +237,9 @@ class EmulatedTerminal:
                 cell = row[x]
                 if getattr(cell, "reverse", False):
                     highlight = (y, x)
-                    if self._debug_logger:
+                    if log is not None:
                         char_repr = repr(getattr(cell, "data", ""))
-                        self._debug_logger(
+                        log(
                             f"[reverse_video] highlight candidate at (x={x}, y={y}) char={char_repr}"
                         )
 
@@ -194,6 +257,7 @@ class EmulatedTerminal:
 
         Returns: (line_index, column_position) or (-1, -1) if not found
         """
+        log = self._debug_logger
         # Strategy: Look for input prompt pattern anywhere in the screen
         # Start from the cursor line and search backwards
 
@@ -206,8 +270,8 @@ class EmulatedTerminal:
                 stripped = line.lstrip()
                 if not (stripped.startswith('│ >') or stripped.startswith('> ')):
                     # Not an input box, probably bash - trust pyte
-                    if self._debug_logger:
-                        self._debug_logger(f"[_find_input_line] Cursor line has content, trusting pyte")
+                    if log is not None:
+                        log(f"[_find_input_line] Cursor line has content, trusting pyte")
                     return (-1, -1)
 
         # Look for input box patterns (Gemini/Claude style)
@@ -216,18 +280,22 @@ class EmulatedTerminal:
         search_end = max(0, cursor_y - 15)
 
         for i in range(search_start, search_end, -1):
-            if i >= len(lines):
-                continue
             line = lines[i]
 
+            # Both patterns need a '>' - skip everything else with one scan
+            if '>' not in line:
+                continue
+
             # Pattern 1: Gemini box style "│ > ..."
-            if '│ >' in line:
-                prompt_idx = line.index('│ >') + 3  # After "│ >"
+            box_idx = line.find('│ >')
+            if box_idx >= 0:
+                prompt_idx = box_idx + 3  # After "│ >"
 
                 # Extract content between prompt and trailing │
                 content_after_prompt = line[prompt_idx:]
-                if '│' in content_after_prompt:
-                    content_after_prompt = content_after_prompt[:content_after_prompt.rindex('│')]
+                bar_idx = content_after_prompt.rfind('│')
+                if bar_idx >= 0:
+                    content_after_prompt = content_after_prompt[:bar_idx]
 
                 content = content_after_prompt.strip()
 
@@ -239,9 +307,9 @@ class EmulatedTerminal:
                 if content:
                     cursor_col += 1
 
-                if self._debug_logger:
-                    self._debug_logger(f"[_find_input_line] Found Gemini box at line {i}, col {cursor_col}")
-                    self._debug_logger(f"[_find_input_line] Line: {repr(line[:100])}, Content: {repr(content)}")
+                if log is not None:
+                    log(f"[_find_input_line] Found Gemini box at line {i}, col {cursor_col}")
+                    log(f"[_find_input_line] Line: {_preview(line, 100)}, Content: {repr(content)}")
 
                 return (i, cursor_col)
 
@@ -259,8 +327,8 @@ class EmulatedTerminal:
                             break
 
                 if has_separator or stripped == '>' or stripped.startswith('> '):
-                    # Found Claude-style prompt
-                    prompt_idx = line.index('>') + 1  # After ">"
+                    # Found Claude-style prompt; stripped starts with the first '>'
+                    prompt_idx = len(line) - len(stripped) + 1  # After ">"
 
                     # Skip optional space after >
                     if prompt_idx < len(line) and line[prompt_idx] == ' ':
@@ -271,15 +339,15 @@ class EmulatedTerminal:
                     if content_after_prompt:
                         cursor_col += 1
 
-                    if self._debug_logger:
-                        self._debug_logger(f"[_find_input_line] Found Claude prompt at line {i}, col {cursor_col}")
-                        self._debug_logger(f"[_find_input_line] Line: {repr(line[:100])}, Content: {repr(content_after_prompt)}")
+                    if log is not None:
+                        log(f"[_find_input_line] Found Claude prompt at line {i}, col {cursor_col}")
+                        log(f"[_find_input_line] Line: {_preview(line, 100)}, Content: {repr(content_after_prompt)}")
 
                     return (i, cursor_col)
 
         # No input box found, trust pyte
-        if self._debug_logger:
-            self._debug_logger(f"[_find_input_line] No input box found, trusting pyte")
+        if log is not None:
+            log(f"[_find_input_line] No input box found, trusting pyte")
         return (-1, -1)
 
     def text_with_cursor(self, cursor_char: str = "▌", show: bool = True) -> str:
@@ -288,26 +356,34 @@ class EmulatedTerminal:
         When pyte is active, uses screen.cursor (x,y). Otherwise, appends
         a caret at end of the last line.
         """
-        if not show:
-            return self.text()
-        if not self._use_pyte:
-            base = self._screen.display_text()  # type: ignore
-            if not base:
-                return cursor_char
-            lines = base.splitlines()
-            if lines:
-                lines[-1] = f"{lines[-1]}{cursor_char}"
-            return "\n".join(lines)
-
+        with self._lock:
+            if not show:
+                return self.text()
+            self.flush_feed()
+            return self._render_with_cursor(cursor_char)
+
+    def _plain_text_with_cursor(self, cursor_char: str) -> str:
+        """Plain-mode caret: append to the end of the last line."""
+        base = self._screen.display_text()  # type: ignore
+        if not base:
+            return cursor_char
+        lines = base.splitlines()
+        if lines:
+            lines[-1] = f"{lines[-1]}{cursor_char}"
+        return "\n".join(lines)
+
+    def _pyte_text_with_cursor(self, cursor_char: str) -> str:
+        """pyte-mode caret: reverse-video, prompt heuristics, then VT cursor."""
+        log = self._debug_logger
         try:
             # Obtain current display and cursor position
             lines = list(self._screen.display)  # type: ignore[attr-defined]
-            cx = getattr(self._screen, "cursor").x  # type: ignore[attr-defined]
-            cy = getattr(self._screen, "cursor").y  # type: ignore[attr-defined]
+            cursor = self._screen.cursor  # type: ignore[attr-defined]
+            cx, cy = cursor.x, cursor.y
 
-            if self._debug_logger:
-                self._debug_logger(f"[text_with_cursor] pyte cursor position: (x={cx}, y={cy})")
-                self._debug_logger(f"[text_with_cursor] total lines in display: {len(lines)}")
+            if log is not None:
+                log(f"[text_with_cursor] pyte cursor position: (x={cx}, y={cy})")
+                log(f"[text_with_cursor] total lines in display: {len(lines)}")
 
             target_source = "vt"
             target_y = cy
@@ -318,8 +394,8 @@ class EmulatedTerminal:
             if highlight_y != -1 and highlight_x != -1:
                 target_y, target_x = highlight_y, highlight_x
                 target_source = "reverse-video"
-                if self._debug_logger:
-                    self._debug_logger(
+                if log is not None:
+                    log(
                         f"[text_with_cursor] using reverse-video cursor at (x={highlight_x}, y={highlight_y})"
                     )
             else:
@@ -328,74 +404,79 @@ class EmulatedTerminal:
                 if pattern_y != -1 and pattern_x != -1:
                     target_y, target_x = pattern_y, pattern_x
                     target_source = "pattern"
-                    if self._debug_logger:
-                        self._debug_logger(
+                    if log is not None:
+                        log(
                             f"[text_with_cursor] using pattern cursor at (x={pattern_x}, y={pattern_y})"
                         )
                 else:
-                    if self._debug_logger:
-                        self._debug_logger(
+                    if log is not None:
+                        log(
                             "[text_with_cursor] falling back to VT cursor position"
                         )
 
             if 0 <= target_y < len(lines):
                 line = lines[target_y]
-                if self._debug_logger:
-                    self._debug_logger(
-                        f"[text_with_cursor] source={target_source} line[{target_y}] length={len(line)}, content={repr(line[:80])}"
+                if log is not None:
+                    log(
+                        f"[text_with_cursor] source={target_source} line[{target_y}] length={len(line)}, content={_preview(line, 80)}"
                     )
-                    # Log the full line in hex to see any hidden characters
-                    line_bytes = line.encode('utf-8', errors='replace')
-                    if len(line_bytes) > 200:
-                        self._debug_logger(f"[text_with_cursor] line_bytes(truncated)={line_bytes[:200]}")
+                    # Log the line as bytes to see any hidden characters; each
+                    # char encodes to at most 4 bytes, so 200 chars cover the
+                    # first 200 bytes without encoding the whole line.
+                    line_bytes = line[:200].encode('utf-8', errors='replace')
+                    if len(line_bytes) > 200 or len(line) > 200:
+                        log(f"[text_with_cursor] line_bytes(truncated)={line_bytes[:200]}")
                     else:
-                        self._debug_logger(f"[text_with_cursor] line_bytes={line_bytes}")
+                        log(f"[text_with_cursor] line_bytes={line_bytes}")
 
                 # Map column to string index
                 idx = self._index_from_column(line, target_x)
 
-                if self._debug_logger:
-                    self._debug_logger(
+                if log is not None:
+                    log(
                         f"[text_with_cursor] calculated string index={idx} for column={target_x}"
                     )
 
                 if idx >= len(line):
                     line = line + " "
                     idx = len(line) - 1
-                    if self._debug_logger:
-                        self._debug_logger(f"[text_with_cursor] index beyond line, appended space, new_idx={idx}")
+                    if log is not None:
+                        log(f"[text_with_cursor] index beyond line, appended space, new_idx={idx}")
 
                 # Insert cursor character
                 modified_line = line[:idx] + cursor_char + line[idx:]
-                if self._debug_logger:
-                    self._debug_logger(f"[text_with_cursor] inserting cursor at idx={idx}")
-                    self._debug_logger(f"[text_with_cursor] before={repr(line[max(0,idx-10):idx+10])}")
-                    self._debug_logger(f"[text_with_cursor] after={repr(modified_line[max(0,idx-10):idx+15])}")
+                if log is not None:
+                    log(f"[text_with_cursor] inserting cursor at idx={idx}")
+                    log(f"[text_with_cursor] before={repr(line[max(0,idx-10):idx+10])}")
+                    log(f"[text_with_cursor] after={repr(modified_line[max(0,idx-10):idx+15])}")
 
                 lines[target_y] = modified_line
             return "\n".join(lines)
         except Exception as e:
-            if self._debug_logger:
-                self._debug_logger(f"[text_with_cursor] ERROR: {e}")
+            if log is not None:
+                log(f"[text_with_cursor] ERROR: {e}")
             return self.text()
 
     def resize(self, cols: int, rows: int) -> None:
-        self.cols = cols
-        self.rows = rows
-        if self._use_pyte:
-            try:
-                # CRITICAL: pyte.Screen.resize(lines, columns) not (columns, lines)!
-                self._screen.resize(lines=rows, columns=cols)  # type: ignore[attr-defined]
-                # Debug: verify the resize actually worked
-                if self._debug_logger:
-                    actual_cols = getattr(self._screen, 'columns', '?')
-                    actual_rows = getattr(self._screen, 'lines', '?')
-                    self._debug_logger(f"[Emulator] resize(cols={cols}, rows={rows}) → pyte screen is now {actual_cols}x{actual_rows}")
-            except Exception as e:
-                if self._debug_logger:
-                    self._debug_logger(f"[Emulator] resize(cols={cols}, rows={rows}) FAILED: {e}")
-        else:
-            self._screen.resize(cols, rows)  # type: ignore
+        with self._lock:
+            # Output produced before the resize belongs to the old geometry
+            self.flush_feed()
+            self.cols = cols
+            self.rows = rows
+            if self._use_pyte:
+                try:
+                    # CRITICAL: pyte.Screen.resize(lines, columns) not (columns, lines)!
+                    self._screen.resize(lines=rows, columns=cols)  # type: ignore[attr-defined]
+                    # Debug: verify the resize actually worked
+                    if self._debug_logger:
+                        actual_cols = getattr(self._screen, 'columns', '?')
+                        actual_rows = getattr(self._screen, 'lines', '?')
+                        self._debug_logger(f"[Emulator] resize(cols={cols}, rows={rows}) → pyte screen is now {actual_cols}x{actual_rows}")
+                except Exception as e:
+                    if self._debug_logger:
+                        self._debug_logger(f"[Emulator] resize(cols={cols}, rows={rows}) FAILED: {e}")
+            else:
+                self._screen.resize(cols, rows)  # type: ignore
 
     @property
     def mode(self) -> str:
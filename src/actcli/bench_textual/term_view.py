@@ -12,6 +12,40 @@ except Exception:  # pragma: no cover
     from textual.events import MouseScrollUp, MouseScrollDown  # type: ignore
 
 
+# Ctrl+<char> → C0 control character (Ctrl+A = \x01 ... Ctrl+Z = \x1a,
+# Ctrl+[ = ESC, Ctrl+@ = NUL, ...). Looked up by lowercased key.
+_CTRL_TABLE: dict[str, str] = {
+    c: chr(ord(c) & 0x1F) for c in "abcdefghijklmnopqrstuvwxyz@[\\]^_"
+}
+
+# Named keys → escape sequences written to the PTY
+_CONTROL_KEYS: dict[str, str] = {
+    "enter": "\r",
+    "return": "\r",
+    "backspace": "\x7f",
+    "tab": "\t",
+    "escape": "\x1b",
+    "left": "\x1b[D",
+    "right": "\x1b[C",
+    "up": "\x1b[A",
+    "down": "\x1b[B",
+    "home": "\x1b[H",
+    "end": "\x1b[F",
+    "pageup": "\x1b[5~",
+    "pagedown": "\x1b[6~",
+    "delete": "\x1b[3~",
+    "insert": "\x1b[2~",
+}
+
+# Ctrl+<key> → (navigator action, amount in lines) for scrollback
+_NAV_KEYS: dict[str, tuple[str, int]] = {
+    "pageup": ("pageup", -20),
+    "pagedown": ("pagedown", 20),
+    "home": ("home", 0),
+    "end": ("end", 0),
+}
+
+
 class TermView(Static):
     """Focusable terminal view that forwards keystrokes to a writer.
 
@@ -87,67 +121,36 @@ class TermView(Static):
 
     def on_key(self, event: Key) -> None:  # type: ignore[override]
         try:
+            key = getattr(event, 'key', '') or ''
+            ch = getattr(event, 'character', None)
+            mods = getattr(event, 'modifiers', ()) or ()
+            k = key.lower()
+
             # Scrollback with Ctrl+PageUp/PageDown/Home/End
-            if self._navigator and getattr(event, 'key', None):
-                k = (event.key or '').lower()
-                mods = set(getattr(event, 'modifiers', []) or [])
-                if 'ctrl' in mods and k in ('pageup','pagedown','home','end'):
-                    mapping = {
-                        'pageup': ('pageup', -20),
-                        'pagedown': ('pagedown', 20),
-                        'home': ('home', 0),
-                        'end': ('end', 0),
-                    }
-                    action, amount = mapping[k]
-                    if self._navigator(action, amount):
-                        event.stop()
-                        return
+            if self._navigator and 'ctrl' in mods:
+                nav = _NAV_KEYS.get(k)
+                if nav is not None and self._navigator(*nav):
+                    event.stop()
+                    return
             if not self._writer:
                 return
 
-            seq: Optional[str] = None
-            k = (event.key or '').lower()
-            mods = set(getattr(event, "modifiers", []) or [])
-
             if self._key_logger:
                 try:
-                    self._key_logger(k, getattr(event, 'character', None), mods)
+                    self._key_logger(k, ch, set(mods))
                 except Exception:
                     pass
 
             # Printable characters
-            ch = getattr(event, 'character', None)
             if ch and len(ch) == 1:
-                seq = ch
-            elif not ch and k and len(k) == 1 and not any(mod in getattr(event, "modifiers", []) for mod in ("ctrl", "alt", "meta")):
+                seq: Optional[str] = ch
+            elif not ch and len(k) == 1 and not any(m in mods for m in ("ctrl", "alt", "meta")):
                 seq = k
-
-            # Control keys
-            mapping = {
-                "enter": "\r",
-                "return": "\r",
-                "backspace": "\x7f",
-                "tab": "\t",
-                "escape": "\x1b",
-                "left": "\x1b[D",
-                "right": "\x1b[C",
-                "up": "\x1b[A",
-                "down": "\x1b[B",
-                "home": "\x1b[H",
-                "end": "\x1b[F",
-                "pageup": "\x1b[5~",
-                "pagedown": "\x1b[6~",
-                "delete": "\x1b[3~",
-                "insert": "\x1b[2~",
-            }
-
-            if seq is None:
-                seq = mapping.get(k)
-
-            # Ctrl+<char> handling
-            if seq is None and "ctrl" in mods and k and len(k) == 1:
-                ctrl_char = k.upper()
-                seq = chr(ord(ctrl_char) & 0x1F)
+            else:
+                # Control keys, then Ctrl+<char>
+                seq = _CONTROL_KEYS.get(k)
+                if seq is None and "ctrl" in mods:
+                    seq = _CTRL_TABLE.get(k)
 
             if seq is not None:
                 try:
@@ -15,14 +15,54 @@ documentation of these orderings.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Callable, List
-import re
+from itertools import chain, islice
+from typing import Deque, Dict, NamedTuple, Optional, Callable, List
+import queue
+import threading
+import time
 from datetime import datetime
 
 from .instrumentation.probe_responder import TerminalProbeResponder
-from .terminal_runner import TerminalRunner
-from .term_emulator import EmulatedTerminal
+from .terminal_runner import PtyReader, TerminalRunner
+from .term_emulator import EmulatedTerminal, _strip_ansi
+
+
+DEFAULT_MAX_SCROLLBACK_LINES = 2000
+
+# Characters of raw PTY output kept per terminal for diagnostics previews
+OUTPUT_TAIL_CHARS = 4096
+
+# Most queued output the worker merges into one processing pass
+OUTPUT_BATCH_CHARS = 262144
+
+# Longest unterminated line held back from scrollback; full-screen apps may
+# never send a newline, so past this the tail is committed as a line
+PARTIAL_LINE_MAX_CHARS = 4096
+
+
+# Resize syncs remembered per terminal for troubleshooting packs
+WINSIZE_HISTORY_LEN = 20
+
+
+class WinsizeEntry(NamedTuple):
+    """One recorded resize sync; formatted only when displayed."""
+
+    timestamp: float  # time.time()
+    cols: int
+    rows: int
+    emu_cols: int
+    emu_rows: int
+    actual: Optional[tuple[int, int]]
+
+    def __str__(self) -> str:
+        stamp = datetime.fromtimestamp(self.timestamp).strftime("%H:%M:%S.%f")[:-3]
+        return (
+            f"{stamp} view={self.cols}x{self.rows} "
+            f"emu={self.emu_cols}x{self.emu_rows} "
+            f"requested={self.rows}x{self.cols} actual={self.actual}"
+        )
 
 
 @dataclass
@@ -33,12 +73,42 @@ class TerminalState:
     """
     item: TerminalRunner
     emulator: EmulatedTerminal
-    scroll_buffer: List[str] = field(default_factory=list)
+    scroll_buffer: Deque[str] = field(
+        default_factory=lambda: deque(maxlen=DEFAULT_MAX_SCROLLBACK_LINES)
+    )
     scroll_offset: int = 0
-    winsize_history: List[str] = field(default_factory=list)
-    output_buffer: str = ""
+    # Bumped whenever scroll_buffer changes; keys scroll_view_cache, the
+    # last rendered (offset, height, version, text) scrollback window
+    scroll_version: int = 0
+    scroll_view_cache: Optional[tuple[int, int, int, str]] = field(default=None, repr=False)
+    winsize_history: Deque[WinsizeEntry] = field(
+        default_factory=lambda: deque(maxlen=WINSIZE_HISTORY_LEN)
+    )
+    output_chunks: Deque[str] = field(default_factory=deque)
+    output_size: int = 0
+    # Joined tail, valid until the next append_output()
+    output_tail_cache: Optional[str] = field(default=None, repr=False)
+    partial_line: str = ""
     last_synced_size: Optional[tuple[int, int]] = None
 
+    def append_output(self, text: str) -> None:
+        """Record raw output, dropping whole chunks that fall out of the tail."""
+        chunks = self.output_chunks
+        chunks.append(text)
+        self.output_tail_cache = None
+        self.output_size += len(text)
+        # Evict only while the remaining chunks still cover the full tail
+        while len(chunks) > 1 and self.output_size - len(chunks[0]) >= OUTPUT_TAIL_CHARS:
+            self.output_size -= len(chunks.popleft())
+
+    @property
+    def output_buffer(self) -> str:
+        """Last OUTPUT_TAIL_CHARS characters of raw output (joined on demand)."""
+        tail = self.output_tail_cache
+        if tail is None:
+            tail = self.output_tail_cache = "".join(self.output_chunks)[-OUTPUT_TAIL_CHARS:]
+        return tail
+
 
 class TerminalManager:
     """Manages terminal lifecycle, sizing, and I/O.
@@ -55,7 +125,7 @@ class TerminalManager:
         self,
         debug_logger: Optional[Callable[[str], None]] = None,
         log_manager: Optional[object] = None,  # LogManager
-        max_scrollback_lines: int = 2000,
+        max_scrollback_lines: int = DEFAULT_MAX_SCROLLBACK_LINES,
         on_output_callback: Optional[Callable[[str, str], None]] = None
     ):
         """Initialize terminal manager.
@@ -69,11 +139,21 @@ class TerminalManager:
         self.terminals: Dict[str, TerminalState] = {}
         self.active_terminal: Optional[str] = None
         self._debug_logger = debug_logger or (lambda msg: None)
+        # Emulators get the caller's logger as-is: None lets them skip their
+        # per-frame debug formatting entirely.
+        self._emulator_debug_logger = debug_logger
         self._log_manager = log_manager
         self.max_scrollback_lines = max_scrollback_lines
         self._emulator_mode_logged: set[str] = set()
         self._on_output_callback = on_output_callback
         self._probe_responder = TerminalProbeResponder()
+        # One reader thread serves every terminal's PTY (created on first use)
+        self._pty_reader: Optional[PtyReader] = None
+        # The reader only queues decoded output; emulator feeding, probe
+        # replies and scrollback run on a separate worker so slow parsing
+        # never stalls draining the PTYs.
+        self._output_queue: "queue.SimpleQueue[tuple[Optional[str], Optional[str]]]" = queue.SimpleQueue()
+        self._output_worker: Optional[threading.Thread] = None
 
     def add_terminal(self, name: str, command: List[str]) -> bool:
         """Create and start a new terminal.
@@ -97,18 +177,21 @@ class TerminalManager:
             debug_logger=self._debug_logger
         )
 
-        # Set output callback to capture terminal output
+        # Set output callback to capture terminal output (runs on the
+        # reader thread, so it only hands the text to the output worker)
         def on_output(text: str):
-            self._append_terminal_output(name, text)
+            self._output_queue.put((name, text))
 
         def on_exit(code: int):
             self._debug_logger(f"Terminal '{name}' exited with code {code}")
+            # Queued behind the last output: commit its unterminated line
+            self._output_queue.put((name, None))
 
         runner.on_output(on_output)
         runner.on_exit(on_exit)
 
         # Create emulator first (before starting, so it's ready for output)
-        emulator = EmulatedTerminal(debug_logger=self._debug_logger)
+        emulator = EmulatedTerminal(debug_logger=self._emulator_debug_logger)
 
         # Log emulator mode once
         self._log_emulator_mode(name, emulator)
@@ -117,10 +200,8 @@ class TerminalManager:
         state = TerminalState(
             item=runner,
             emulator=emulator,
-            scroll_buffer=[],
+            scroll_buffer=deque(maxlen=self.max_scrollback_lines),
             scroll_offset=0,
-            winsize_history=[],
-            output_buffer="",
             last_synced_size=None
         )
 
@@ -132,7 +213,10 @@ class TerminalManager:
             self.active_terminal = name
 
         # Start the PTY (may exit quickly, but that's OK - we've already added it)
-        started = runner.start()
+        self._start_output_worker()
+        if self._pty_reader is None:
+            self._pty_reader = PtyReader()
+        started = runner.start(reader=self._pty_reader)
         if not started:
             self._debug_logger(f"Terminal '{name}' started but exited quickly")
         else:
@@ -141,6 +225,27 @@ class TerminalManager:
         # Return True even if process exited quickly - the terminal was created
         return True
 
+    def shutdown(self) -> None:
+        """Close every terminal and stop the output worker and PTY reader.
+
+        Output still queued is processed before the worker exits. The
+        manager can be used again afterwards; threads restart on demand.
+        """
+        for name in list(self.terminals):
+            try:
+                self.remove_terminal(name)
+            except Exception as e:
+                self._debug_logger(f"[{name}] close on shutdown failed: {e!r}")
+        worker = self._output_worker
+        if worker is not None:
+            self._output_queue.put((None, None))
+            worker.join(timeout=1.0)
+            self._output_worker = None
+        reader = self._pty_reader
+        if reader is not None:
+            self._pty_reader = None
+            reader.close()
+
     def remove_terminal(self, name: str) -> bool:
         """Stop and remove a terminal.
 
@@ -155,6 +260,7 @@ class TerminalManager:
 
         state = self.terminals[name]
         state.item.close()
+        self._flush_partial_line(name, state)
         del self.terminals[name]
 
         # Update active terminal if needed
@@ -196,18 +302,10 @@ class TerminalManager:
             runner.set_winsize(rows=rows, cols=cols)
             actual = runner.get_winsize()
 
-            # Log to winsize history
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            history_entry = (
-                f"{timestamp} view={cols}x{rows} "
-                f"emu={emu.cols}x{emu.rows} "
-                f"requested={rows}x{cols} actual={actual}"
+            # Log to winsize history (bounded deque; formatted when displayed)
+            state.winsize_history.append(
+                WinsizeEntry(time.time(), cols, rows, emu.cols, emu.rows, actual)
             )
-            state.winsize_history.append(history_entry)
-
-            # Keep last 20 entries
-            if len(state.winsize_history) > 20:
-                state.winsize_history = state.winsize_history[-20:]
 
             self._debug_logger(f"Synced PTY winsize: requested={rows}x{cols} actual={actual}")
 
@@ -268,90 +366,190 @@ class TerminalManager:
 
         state = self.terminals[name]
         buf = state.scroll_buffer
-
-        if not buf:
+        # The unterminated last line (e.g. a shell prompt) is shown too
+        tail = _strip_ansi(state.partial_line) if state.partial_line else ""
+        total = len(buf) + (1 if tail else 0)
+        if not total:
             return None
 
+        # Re-rendering an unchanged window (every frame while scrolled back
+        # with no new output) returns the cached string
+        cache = state.scroll_view_cache
+        version = state.scroll_version
+        if cache is not None and cache[:3] == (offset, height, version):
+            return cache[3]
+
         # Calculate view window
-        start = max(0, len(buf) - height - offset)
-        view = buf[start:start + height]
+        start = max(0, total - height - offset)
+        lines = chain(buf, (tail,)) if tail else buf
+        view = islice(lines, start, start + height)
 
         # Add indicator if scrolled
         indicator = f"[SCROLLBACK offset={offset}]\n" if offset > 0 else ""
-        return indicator + "\n".join(view)
+        text = indicator + "\n".join(view)
+        state.scroll_view_cache = (offset, height, version, text)
+        return text
+
+    def _start_output_worker(self) -> None:
+        """Start the output worker thread unless it is already running."""
+        if self._output_worker is None:
+            self._output_worker = threading.Thread(
+                target=self._output_worker_loop, name="terminal-output", daemon=True
+            )
+            self._output_worker.start()
+
+    def _output_worker_loop(self) -> None:
+        """Process queued PTY output in arrival order (output worker thread).
+
+        Everything already queued is drained at once and merged per
+        terminal, so a burst of small reads costs one pass through the
+        emulator, scrollback and UI callback instead of one per read.
+        Returns once shutdown() queues its (None, None) stop marker.
+        """
+        q = self._output_queue
+        stopping = False
+        while not stopping:
+            name, text = q.get()
+            batch: Dict[str, List[str]] = {}
+            # Terminals whose child exited; None is queued after their output
+            exited: List[str] = []
+            size = 0
+            while True:
+                if name is None:
+                    stopping = True
+                    break
+                if text is None:
+                    exited.append(name)
+                else:
+                    batch.setdefault(name, []).append(text)
+                    size += len(text)
+                if size >= OUTPUT_BATCH_CHARS:
+                    break
+                try:
+                    name, text = q.get_nowait()
+                except queue.Empty:
+                    break
+            for name, chunks in batch.items():
+                try:
+                    self._append_terminal_output(
+                        name, chunks[0] if len(chunks) == 1 else "".join(chunks)
+                    )
+                except Exception as e:
+                    self._debug_logger(f"[{name}] output processing failed: {e!r}")
+            for name in exited:
+                state = self.terminals.get(name)
+                try:
+                    if state is not None:
+                        self._flush_partial_line(name, state)
+                except Exception as e:
+                    self._debug_logger(f"[{name}] final line flush failed: {e!r}")
+
+    def _feed_answering_dsr(self, name: str, state: TerminalState, text: str) -> None:
+        """Feed ``text`` to the emulator, replying to each ESC[6n in turn.
+
+        A chunk may merge several child writes (drained reads, batched
+        queue entries), so everything before a query is fed first and the
+        reply reports the cursor as of that query, not of the chunk start.
+        """
+        emu = state.emulator
+        start = 0
+        while True:
+            query = text.find("\x1b[6n", start)
+            if query == -1:
+                break
+            end = query + 4
+            emu.feed(text[start:end])
+            start = end
+            response = self._probe_responder.response_for_text(text[query:end], emu)
+            if response is not None:
+                self._debug_logger(f"[{name}] DSR → responding with {repr(response)}")
+                try:
+                    state.item.write(response)
+                except Exception:
+                    pass
+        if start < len(text):
+            emu.feed(text[start:])
 
     def _append_terminal_output(self, name: str, text: str) -> None:
         """Process output from terminal PTY.
 
-        This is called by the PTY runner's output callback.
+        This is called on the output worker with text queued by the PTY
+        runner's output callback.
 
         Args:
             name: Terminal identifier
             text: Raw output from PTY
         """
-        if name not in self.terminals:
+        state = self.terminals.get(name)
+        if state is None:
             return
-
-        state = self.terminals[name]
         emu = state.emulator
 
-        # Respond to Device Status Report requests (ESC[6n)
-        if "\x1b[6n" in text:
-            response = self._probe_responder.response_for_text(text, emu)
-            if response is not None:
-                self._debug_logger(f"[{name}] DSR → responding with {repr(response)}")
-                try:
-                    state.item.write(response)
-                except Exception:
-                    pass
+        # One scan for ESC serves both the DSR check and the scrollback strip;
+        # the common escape-free chunk is not scanned again.
+        esc = text.find("\x1b")
 
-        # Feed to emulator
-        emu.feed(text)
+        # Feed to emulator, answering Device Status Report requests (ESC[6n)
+        if esc != -1 and text.find("\x1b[6n", esc) != -1:
+            self._feed_answering_dsr(name, state, text)
+        else:
+            emu.feed(text)
 
         # Update output buffer
-        state.output_buffer += text
-        if len(state.output_buffer) > 4096:
-            state.output_buffer = state.output_buffer[-4096:]
-
-        # Update scrollback buffer (ANSI-stripped plain text)
-        for line in text.splitlines():
-            clean = self._strip_ansi(line)
-            if clean:
-                state.scroll_buffer.append(clean)
-                if len(state.scroll_buffer) > self.max_scrollback_lines:
-                    state.scroll_buffer.pop(0)
-
-                # Log to LogManager if available
-                if self._log_manager:
-                    try:
-                        self._log_manager.add("output", f"[{name}] {clean}")
-                    except Exception:
-                        pass
+        state.append_output(text)
+
+        # Update scrollback buffer (ANSI-stripped plain text). Only complete
+        # lines are committed; an unterminated tail waits for the next chunk
+        # so lines and escape sequences split across reads stay whole.
+        partial = state.partial_line
+        has_esc = esc != -1 or "\x1b" in partial
+        data = partial + text
+        cut = max(data.rfind("\n"), data.rfind("\r")) + 1
+        if len(data) - cut > PARTIAL_LINE_MAX_CHARS:
+            # Full-screen apps may never send a newline; don't hold forever
+            cut = len(data)
+        state.partial_line = data[cut:]
+        if partial or state.partial_line:
+            # get_scrollback_text shows the partial line as well
+            state.scroll_version += 1
+        if cut:
+            self._commit_scroll_lines(name, state, data[:cut], has_esc)
 
         # Notify app.py if callback is set
         if self._on_output_callback:
             self._on_output_callback(name, text)
 
-    def _strip_ansi(self, s: str) -> str:
-        """Strip ANSI escape sequences from string.
-
-        Args:
-            s: String potentially containing ANSI codes
-
-        Returns:
-            Cleaned string
-        """
-        patterns = [
-            r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])",
-            r"\x1B\][^\x07]*\x07",
-            r"\x1B\][^\x1B]*\x1B\\",
-            r"\x1B[PX^_][^\x1B]*\x1B\\",
-            r"\x1B[\[\]()][0-9;]*[A-Za-z<>]",
-        ]
-        result = s
-        for pattern in patterns:
-            result = re.sub(pattern, "", result)
-        return result
+    def _commit_scroll_lines(
+        self, name: str, state: TerminalState, complete: str, has_esc: bool
+    ) -> None:
+        """Add complete output lines to scrollback and the output log."""
+        # Most program output has no escapes and skips the regex entirely
+        plain = _strip_ansi(complete) if has_esc else complete
+        # filter(None, ...) drops blank lines without a Python-level loop
+        new_lines = list(filter(None, plain.splitlines()))
+        if not new_lines:
+            return
+        # Bounded deque: the oldest lines drop off in O(1)
+        state.scroll_buffer.extend(new_lines)
+        state.scroll_version += 1
+
+        # Log to LogManager if available
+        log_manager = self._log_manager
+        if log_manager:
+            prefix = f"[{name}] "
+            try:
+                log_manager.add("output", prefix + ("\n" + prefix).join(new_lines))
+            except Exception:
+                pass
+
+    def _flush_partial_line(self, name: str, state: TerminalState) -> None:
+        """Commit the unterminated last line once no more output will follow."""
+        partial = state.partial_line
+        if not partial:
+            return
+        state.partial_line = ""
+        state.scroll_version += 1
+        self._commit_scroll_lines(name, state, partial, "\x1b" in partial)
 
     def _log_emulator_mode(self, name: str, emulator: EmulatedTerminal) -> None:
         """Log emulator mode once per terminal.
@@ -392,6 +590,14 @@ class TerminalManager:
         """
         return list(self.terminals.keys())
 
+    def list_terminal_states(self) -> List[tuple[str, bool]]:
+        """Get (name, muted) for every terminal in one pass.
+
+        Returns:
+            List of (terminal identifier, muted flag) tuples
+        """
+        return [(name, state.item.muted) for name, state in list(self.terminals.items())]
+
     def is_terminal_alive(self, name: str) -> bool:
         """Check if terminal process is alive.
 
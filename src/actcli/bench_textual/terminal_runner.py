@@ -2,7 +2,8 @@
 
 This wrapper aims to behave like an integrated terminal:
 - Full stdin passthrough to the child process
-- Periodic non-blocking reads from the PTY master to capture output
+- Non-blocking reads from the PTY master, one shared reader thread
+  (PtyReader) for all runners of a TerminalManager
 - A simple, line-oriented callback to stream output to the UI
 
 Notes:
@@ -13,9 +14,12 @@ Notes:
 
 from __future__ import annotations
 
+import codecs
+import heapq
+import itertools
 import os
 import pty
-import select
+import selectors
 import sys
 import threading
 import fcntl
@@ -33,25 +37,244 @@ from .instrumentation.write_trace_logger import WriteTraceLogger
 OutputCallback = Callable[[str], None]
 ExitCallback = Callable[[int], None]
 
+# Bytes requested per read on the PTY master, and the most we drain per
+# wakeup (the size of the reader's reusable buffer) before handing a batch
+# to the output callback. Both are page multiples; a read asks for a full
+# 64 KiB (pipe-buffer sized) and the non-blocking drain keeps reading until
+# EAGAIN, so bulk output costs one wakeup per 256 KiB at most.
+READ_CHUNK_SIZE = 65536
+READ_BATCH_LIMIT = 262144
+
+# How long the exit status is polled for once the PTY reports EOF, and how
+# often; polls are reader timers, so the shared thread never sleeps on them
+EXIT_STATUS_WAIT_SECONDS = 0.1
+EXIT_STATUS_RETRY_SECONDS = 0.005
+
+# Sent after injected text; a carriage return is Enter for every TUI
+_ENTER = b"\r"
+
+# Written to PtyReader's wake fd: 8 bytes (counter += 1) satisfies an
+# eventfd write and is harmless on the pipe fallback
+_WAKE_BYTES = (1).to_bytes(8, sys.byteorder)
+
+# Bytes of initial output kept for first_output_preview()
+FIRST_OUTPUT_LIMIT = 2048
+
+# struct winsize: rows, cols, xpixel, ypixel
+_WINSIZE = struct.Struct("HHHH")
+_WINSIZE_QUERY = _WINSIZE.pack(0, 0, 0, 0)
+
+
+class ReaderTimer:
+    """Handle for a callback scheduled with PtyReader.call_later()."""
+
+    __slots__ = ("deadline", "callback")
+
+    def __init__(self, deadline: float, callback: Callable[[], None]) -> None:
+        self.deadline = deadline
+        self.callback: Optional[Callable[[], None]] = callback
+
+    def cancel(self) -> None:
+        self.callback = None
+
+
+class PtyReader:
+    """Single background thread that reads the PTY masters of many runners.
+
+    Each registered runner's master fd sits in one selector; the thread
+    sleeps in the kernel until any of them has output, drains it and hands
+    it to that runner. A TerminalManager shares one reader across all of
+    its terminals; a runner started on its own gets a private one.
+
+    The selector (epoll on Linux) costs one wakeup per output burst and
+    none while idle, and each burst is drained with readv into a reused
+    buffer. io_uring multishot reads would save little beyond that and
+    need a third-party binding, so they are not used.
+    """
+
+    def __init__(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        # Guards selector changes against the drain step, so close() never
+        # closes a master fd while this thread is reading it.
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # close() pokes this to wake the select; an eventfd is a single fd
+        # on Linux, elsewhere fall back to a self-pipe.
+        if hasattr(os, "eventfd"):
+            self._wake_r = self._wake_w = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        else:
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        # (deadline, seq, timer) heap; the select timeout tracks its head
+        self._timers: list[tuple[float, int, ReaderTimer]] = []
+        self._timer_seq = itertools.count()
+
+    def add(self, runner: "TerminalRunner") -> None:
+        """Start watching ``runner.master_fd``; starts the thread on first use."""
+        with self._lock:
+            self._selector.register(runner.master_fd, selectors.EVENT_READ, runner)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="pty-reader", daemon=True)
+                self._thread.start()
+
+    def remove(self, runner: "TerminalRunner") -> None:
+        """Stop watching a runner; safe to call if it was never added."""
+        with self._lock:
+            try:
+                key = self._selector.get_map().get(runner.master_fd)
+                if key is not None and key.data is runner:
+                    self._selector.unregister(runner.master_fd)
+            except Exception:
+                pass
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> ReaderTimer:
+        """Run ``callback`` on the reader thread after ``delay`` seconds.
+
+        Used instead of a threading.Timer so deferred runner work doesn't
+        spawn a thread per terminal. Returns a handle with ``cancel()``.
+        """
+        timer = ReaderTimer(time.monotonic() + delay, callback)
+        with self._lock:
+            heapq.heappush(self._timers, (timer.deadline, next(self._timer_seq), timer))
+        if threading.current_thread() is not self._thread:
+            self._wake()
+        return timer
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_w, _WAKE_BYTES)
+        except Exception:
+            pass
+
+    def _run_due_timers(self) -> Optional[float]:
+        """Fire expired timers; return seconds until the next one (or None)."""
+        due = []
+        with self._lock:
+            now = time.monotonic()
+            while self._timers and self._timers[0][0] <= now:
+                due.append(heapq.heappop(self._timers)[2])
+        for timer in due:
+            callback, timer.callback = timer.callback, None
+            if callback is not None:
+                try:
+                    callback()
+                except Exception:
+                    pass
+        # Read the head only now: a callback may have scheduled a timer
+        # (without a wake, being on this thread)
+        with self._lock:
+            if not self._timers:
+                return None
+            return max(0.0, self._timers[0][0] - time.monotonic())
 
-@dataclass
+    def close(self) -> None:
+        """Stop the thread and release the selector and wake fd(s)."""
+        self._stop_event.set()
+        self._wake()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=0.5)
+        with self._lock:
+            try:
+                self._selector.close()
+            except Exception:
+                pass
+            for fd in {self._wake_r, self._wake_w}:
+                try:
+                    os.close(fd)
+                except Exception:
+                    pass
+
+    def _run(self) -> None:
+        # Hot loop: resolve everything it touches per event up front
+        sel = self._selector
+        select = sel.select
+        fd_map = sel.get_map()
+        unregister = sel.unregister
+        lock = self._lock
+        stopped = self._stop_event.is_set
+        timers = self._timers
+        run_due_timers = self._run_due_timers
+        wake_r = self._wake_r
+        read = os.read
+        # Every drain reads into this one buffer, so steady-state reads
+        # allocate nothing; each batch is handed off before the next drain.
+        read_view = memoryview(bytearray(READ_BATCH_LIMIT))
+        while not stopped():
+            timeout = run_due_timers() if timers else None
+            try:
+                events = select(timeout)
+            except Exception:
+                break
+            for key, _ in events:
+                runner = key.data
+                fd = key.fd
+                if runner is None:
+                    # Wake fd: clear it and re-check the stop event
+                    try:
+                        read(wake_r, 512)
+                    except Exception:
+                        pass
+                    continue
+                with lock:
+                    try:
+                        if fd_map.get(fd) is not key:
+                            continue  # removed while we were waiting
+                    except Exception:
+                        continue
+                    data, eof = runner._drain(fd, read_view)
+                    if eof:
+                        unregister(fd)
+                try:
+                    if data:
+                        runner._handle_output(data)
+                    if eof:
+                        runner._handle_exit()
+                except Exception:
+                    pass
+
+
+@dataclass(slots=True)
 class TerminalRunner:
     name: str
     command: List[str]
     muted: bool = True
     pid: Optional[int] = None
     master_fd: Optional[int] = None
-    _reader_thread: Optional[threading.Thread] = None
     _stop_event: threading.Event = field(default_factory=threading.Event)
     _on_output: Optional[OutputCallback] = None
     _on_exit: Optional[ExitCallback] = None
-    _first_output: bytearray = field(default_factory=bytearray, init=False, repr=False)
+    # Fixed capture buffer for the start of the output; once full the read
+    # path only tests _first_output_full
+    _first_output: bytearray = field(
+        default_factory=lambda: bytearray(FIRST_OUTPUT_LIMIT), init=False, repr=False
+    )
+    _first_output_len: int = field(default=0, init=False, repr=False)
+    _first_output_full: bool = field(default=False, init=False, repr=False)
+    # (captured length, decoded text) so repeated previews skip the decode
+    _first_output_text: Optional[tuple[int, str]] = field(default=None, init=False, repr=False)
     _last_requested_rows: Optional[int] = field(default=None, init=False, repr=False)
     _last_requested_cols: Optional[int] = field(default=None, init=False, repr=False)
     _post_output_resize_pending: bool = field(default=False, init=False, repr=False)
     _post_output_resize_done: bool = field(default=False, init=False, repr=False)
-    _pending_scheduled_resize: Optional[threading.Timer] = field(default=None, init=False, repr=False)
+    # Last (rows, cols, packed) winsize; drag-resize repeats the same size
+    _winsize_cache: Optional[tuple[int, int, bytes]] = field(default=None, init=False, repr=False)
+    _applied_winsize: Optional[tuple[int, int]] = field(default=None, init=False, repr=False)
+    _pending_scheduled_resize: Optional[ReaderTimer] = field(default=None, init=False, repr=False)
+    _pending_exit_check: Optional[ReaderTimer] = field(default=None, init=False, repr=False)
+    _reader: Optional[PtyReader] = field(default=None, init=False, repr=False)
+    _owns_reader: bool = field(default=False, init=False, repr=False)
+    # Set once the child's exit is observed (PTY EOF); is_alive() reads it
+    _exited: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _reaped: bool = field(default=False, init=False, repr=False)
+    _exit_code: Optional[int] = field(default=None, init=False, repr=False)
+    _reap_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
     debug_logger: Optional[Callable[[str], None]] = field(default=None, repr=False)
+    # Set in __post_init__; declared so the slotted class has room for it
+    _write_tracer: Optional[WriteTraceLogger] = field(default=None, init=False, repr=False)
+    # Trailing bytes of a multi-byte UTF-8 sequence split across reads
+    _undecoded: bytes = field(default=b"", init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._write_tracer = WriteTraceLogger.from_env(self.name)
@@ -71,8 +294,19 @@ class TerminalRunner:
                 pass
 
     def set_winsize(self, rows: int, cols: int) -> None:
-        """Set PTY window size and notify child process via SIGWINCH."""
-        self._apply_winsize(rows, cols)
+        """Set PTY window size and notify child process via SIGWINCH.
+
+        A repeat of the size already applied to this PTY, or one the kernel
+        already reports (e.g. set by the child before exec), is dropped so
+        the child isn't made to redraw; the post-output and delayed resizes
+        still re-signal it.
+        """
+        size = (rows, cols)
+        if self._applied_winsize != size:
+            if self.get_winsize() == size:
+                self._applied_winsize = size
+            else:
+                self._apply_winsize(rows, cols)
         self._last_requested_rows = rows
         self._last_requested_cols = cols
         if not self._post_output_resize_done:
@@ -80,61 +314,81 @@ class TerminalRunner:
 
     def _apply_child_winsize(self, rows: int, cols: int) -> None:
         """Set initial winsize inside the child process before exec."""
+        # After pty.fork() fds 0-2 are all the slave tty: one ioctl covers them
         try:
-            winsize = struct.pack("HHHH", rows, cols, 0, 0)
+            fcntl.ioctl(0, termios.TIOCSWINSZ, _WINSIZE.pack(rows, cols, 0, 0))
         except Exception:
-            return
+            pass
         try:
-            import os
-            os.environ["LINES"] = str(rows)
-            os.environ["ROWS"] = str(rows)
-            os.environ["COLUMNS"] = str(cols)
-            os.environ["COLS"] = str(cols)
+            os.environ.update(LINES=str(rows), COLUMNS=str(cols))
         except Exception:
             pass
-        for stream in (sys.stdin, sys.stdout, sys.stderr):
-            try:
-                fd = stream.fileno()
-                fcntl.ioctl(fd, termios.TIOCSWINSZ, winsize)
-            except Exception:
-                continue
 
     def get_winsize(self) -> Optional[tuple[int, int]]:
         """Return current PTY winsize as (rows, cols) if available."""
         if self.master_fd is None:
             return None
         try:
-            data = fcntl.ioctl(self.master_fd, termios.TIOCGWINSZ, struct.pack('HHHH', 0, 0, 0, 0))
-            rows, cols, _, _ = struct.unpack('HHHH', data)
+            data = fcntl.ioctl(self.master_fd, termios.TIOCGWINSZ, _WINSIZE_QUERY)
+            rows, cols, _, _ = _WINSIZE.unpack(data)
             return rows, cols
         except Exception:
             return None
 
     def first_output_preview(self, limit: int = 512) -> str:
-        if not self._first_output:
+        """Return up to ``limit`` characters of the child's first output.
+
+        The capture is decoded once per change in size (at most
+        FIRST_OUTPUT_LIMIT bytes, then never again) and later calls just
+        slice the cached text.
+        """
+        size = self._first_output_len
+        if not size:
             return ""
-        return self._first_output[:limit].decode("utf-8", errors="replace")
+        cached = self._first_output_text
+        if cached is None or cached[0] != size:
+            cached = (size, self._first_output[:size].decode("utf-8", errors="replace"))
+            self._first_output_text = cached
+        return cached[1][:limit]
 
     def _apply_winsize(self, rows: int, cols: int) -> None:
         if self.master_fd is None:
             return
         try:
-            winsize = struct.pack('HHHH', rows, cols, 0, 0)
+            cached = self._winsize_cache
+            if cached is not None and cached[0] == rows and cached[1] == cols:
+                winsize = cached[2]
+            else:
+                winsize = _WINSIZE.pack(rows, cols, 0, 0)
+                self._winsize_cache = (rows, cols, winsize)
             fcntl.ioctl(self.master_fd, termios.TIOCSWINSZ, winsize)
+            self._applied_winsize = (rows, cols)
         except Exception:
             pass
-        if self.pid:
+        # A reaped pid may already belong to another process
+        if self.pid and not self._reaped:
             try:
                 os.kill(self.pid, signal.SIGWINCH)
             except Exception:
                 pass
 
-    def start(self) -> bool:
-        """Fork process in PTY and begin background read loop."""
+    def start(self, reader: Optional[PtyReader] = None) -> bool:
+        """Fork process in PTY and begin background reads.
+
+        Output is read by ``reader`` when given (shared with other
+        runners), otherwise by a reader thread private to this runner.
+        """
         if self.pid is not None:
             return True
 
-        self._first_output.clear()
+        self._first_output_len = 0
+        self._first_output_full = False
+        self._first_output_text = None
+        self._applied_winsize = None
+        self._undecoded = b""
+        self._exited.clear()
+        self._reaped = False
+        self._exit_code = None
         self._post_output_resize_pending = False
         self._post_output_resize_done = False
         if self._pending_scheduled_resize is not None:
@@ -143,6 +397,9 @@ class TerminalRunner:
             except Exception:
                 pass
             self._pending_scheduled_resize = None
+        if self._pending_exit_check is not None:
+            self._pending_exit_check.cancel()
+            self._pending_exit_check = None
 
         pid, master = pty.fork()
         if pid == 0:
@@ -162,11 +419,18 @@ class TerminalRunner:
         # Parent
         self.pid = pid
         self.master_fd = master
+        # Non-blocking master so the reader can drain it until EAGAIN
+        try:
+            flags = fcntl.fcntl(master, fcntl.F_GETFL)
+            fcntl.fcntl(master, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        except Exception:
+            pass
 
-        # Start a background reader thread to avoid blocking the UI loop
+        # Read in the background to avoid blocking the UI loop
         self._stop_event.clear()
-        self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
-        self._reader_thread.start()
+        self._owns_reader = reader is None
+        self._reader = reader if reader is not None else PtyReader()
+        self._reader.add(self)
         # Initialize default window size so child doesn't assume 80x24.
         try:
             self.set_winsize(rows=48, cols=240)
@@ -182,90 +446,257 @@ class TerminalRunner:
         #         os.write(self.master_fd, b"\x1B[?2004l\x1B[?1004l")
         # except Exception:
         #     pass
-        # Quick sanity: detect immediate child exit
-        for _ in range(10):
-            if not self.is_alive():
-                return False
-            time.sleep(0.05)
-        return True
-
-    def _reader_loop(self) -> None:
-        fd = self.master_fd
-        if fd is None:
-            return
-        while not self._stop_event.is_set():
+        # Quick sanity: a child that already failed is reapable right now;
+        # later exits are reported by the reader when the PTY hits EOF.
+        return self._reap() is None
+
+    def _drain(self, fd: int, buf: memoryview) -> tuple[memoryview, bool]:
+        """Read everything currently buffered on the PTY master into ``buf``.
+
+        Returns (data, eof) where ``data`` is the filled prefix of ``buf``;
+        it is only valid until the next drain into the same buffer. Reads
+        until the non-blocking fd would block, the buffer is full, or the
+        child side closes.
+        """
+        total = 0
+        limit = len(buf)
+        while total < limit:
             try:
-                r, _, _ = select.select([fd], [], [], 0.05)
-                if fd in r:
-                    try:
-                        data = os.read(fd, 4096)
-                        if not data:
-                            break
-                        if len(self._first_output) < 2048:
-                            remaining = 2048 - len(self._first_output)
-                            self._first_output.extend(data[:remaining])
-                            if self._pending_scheduled_resize is None and self._last_requested_rows and self._last_requested_cols:
-                                def _delayed_resize() -> None:
-                                    try:
-                                        self._apply_winsize(self._last_requested_rows, self._last_requested_cols)
-                                    finally:
-                                        self._pending_scheduled_resize = None
-                                timer = threading.Timer(0.5, _delayed_resize)
-                                timer.daemon = True
-                                timer.start()
-                                self._pending_scheduled_resize = timer
-
-                        if (
-                            not self._post_output_resize_done
-                            and self._post_output_resize_pending
-                            and self._last_requested_rows is not None
-                            and self._last_requested_cols is not None
-                        ):
-                            self._apply_winsize(self._last_requested_rows, self._last_requested_cols)
-                            self._post_output_resize_pending = False
-                            self._post_output_resize_done = True
-                        if self._on_output:
-                            # Stream as-is; UI may decide how to render
-                            text = data.decode("utf-8", errors="replace")
-                            self._on_output(text)
-                    except OSError:
-                        break
-            except Exception:
+                n = os.readv(fd, [buf[total:total + READ_CHUNK_SIZE]])
+            except BlockingIOError:
                 break
-        # Process exited - get exit status and call callback
-        if self.pid is not None and self._on_exit:
+            except OSError:
+                # EIO: the child closed its side of the PTY
+                return buf[:total], True
+            if not n:
+                return buf[:total], True
+            total += n
+        return buf[:total], False
+
+    def _handle_output(self, data: bytes | memoryview) -> None:
+        """Process one drained chunk from the reader thread.
+
+        ``data`` may be a view into the reader's reused buffer, so nothing
+        here keeps a reference to it: the preview copies its prefix and
+        the decoder hands ``on_output`` a fresh ``str``.
+
+        Once startup is over (capture full, post-output resize done) this
+        reads three slots before decoding; the one-shot startup state is
+        only consulted behind those two flags.
+        """
+        if not self._first_output_full:
+            start = self._first_output_len
+            end = min(start + len(data), FIRST_OUTPUT_LIMIT)
+            self._first_output[start:end] = data[:end - start]
+            self._first_output_len = end
+            self._first_output_full = end == FIRST_OUTPUT_LIMIT
+            reader = self._reader
+            if (
+                reader is not None
+                and self._pending_scheduled_resize is None
+                and self._last_requested_rows
+                and self._last_requested_cols
+            ):
+                def _delayed_resize() -> None:
+                    try:
+                        self._apply_winsize(self._last_requested_rows, self._last_requested_cols)
+                    finally:
+                        self._pending_scheduled_resize = None
+                self._pending_scheduled_resize = reader.call_later(0.5, _delayed_resize)
+
+        if (
+            not self._post_output_resize_done
+            and self._post_output_resize_pending
+            and self._last_requested_rows is not None
+            and self._last_requested_cols is not None
+        ):
+            self._apply_winsize(self._last_requested_rows, self._last_requested_cols)
+            self._post_output_resize_pending = False
+            self._post_output_resize_done = True
+        if self._on_output:
+            # Stream as-is; UI may decide how to render
+            text = self._decode(data)
+            if text:
+                self._on_output(text)
+
+    def _decode(self, data: bytes | memoryview, final: bool = False) -> str:
+        """Decode PTY output as UTF-8, carrying a split sequence to the next call.
+
+        Calls the C decoder directly: unlike the stdlib incremental decoder
+        it doesn't copy every chunk to prepend an (almost always empty)
+        carry buffer, and pure-ASCII output takes the codec's fast path.
+        """
+        if self._undecoded:
+            data = self._undecoded + data
+        text, consumed = codecs.utf_8_decode(data, "replace", final)
+        self._undecoded = bytes(data[consumed:]) if consumed < len(data) else b""
+        return text
+
+    def _reap(self) -> Optional[int]:
+        """Collect the child's exit status without waiting.
+
+        Returns the exit code (-1 if killed by a signal), or None if the
+        child is still running. The code is remembered, and a reaped pid
+        is never signalled again.
+        """
+        with self._reap_lock:
+            pid = self.pid
+            if self._reaped:
+                return self._exit_code
+            if pid is None:
+                return None
+            try:
+                done, status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                done, status = pid, -1
+            if done != pid:
+                return None
+            self._reaped = True
+            self._exited.set()
+            self._exit_code = (
+                os.WEXITSTATUS(status) if status != -1 and os.WIFEXITED(status) else -1
+            )
+            return self._exit_code
+
+    def _handle_exit(self) -> None:
+        """Record the exit and report its status once the PTY hits EOF."""
+        # A truncated trailing sequence becomes U+FFFD rather than vanishing
+        tail = self._decode(b"", final=True)
+        if tail and self._on_output:
             try:
-                _, status = os.waitpid(self.pid, os.WNOHANG)
-                exit_code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
-                self._on_exit(exit_code)
+                self._on_output(tail)
             except Exception:
                 pass
+        # EOF usually lands a moment before the child is reapable
+        self._check_exit(time.monotonic() + EXIT_STATUS_WAIT_SECONDS)
+
+    def _check_exit(self, deadline: float) -> None:
+        """Report the exit once the child is reaped or ``deadline`` passes.
+
+        Runs on the shared reader thread, so an unreapable child is polled
+        again from a reader timer instead of sleeping here while other
+        terminals' output waits.
+        """
+        self._pending_exit_check = None
+        exit_code = self._reap()
+        reader = self._reader
+        if exit_code is None and reader is not None and time.monotonic() < deadline:
+            self._pending_exit_check = reader.call_later(
+                EXIT_STATUS_RETRY_SECONDS, lambda: self._check_exit(deadline)
+            )
+            return
+        self._exited.set()
+        if self._stop_event.is_set() or not self._on_exit:
+            return
+        try:
+            self._on_exit(-1 if exit_code is None else exit_code)
+        except Exception:
+            pass
+
+    def _write_all(self, *parts: bytes) -> None:
+        """Write every part, in order, to the non-blocking master fd.
+
+        Several parts go out in one ``os.writev`` call; whatever the kernel
+        doesn't take is finished off with plain writes. Parts are only
+        wrapped in a memoryview once a write comes back short.
+        """
+        fd = self.master_fd
+        if fd is None:
+            return
+        views = [part for part in parts if part]
+        while views:
+            try:
+                if len(views) > 1:
+                    written = os.writev(fd, views)
+                else:
+                    written = os.write(fd, views[0])
+            except BlockingIOError:
+                # PTY input queue is full (large paste); wait until it drains,
+                # but don't hang the UI on a child that stopped reading.
+                # A selector rather than select.select(): no FD_SETSIZE
+                # limit once many terminals push the master fd past 1024
+                with selectors.DefaultSelector() as sel:
+                    sel.register(fd, selectors.EVENT_WRITE)
+                    writable = sel.select(1.0)
+                if not writable:
+                    self._debug(f"write→pty stalled, dropped {sum(map(len, views))} bytes")
+                    return
+                continue
+            # Drop fully written parts, then trim the partially written one
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if written:
+                views[0] = memoryview(views[0])[written:]
 
     def write(self, data: str) -> None:
         """Write text to the child's stdin (via PTY)."""
         if self.master_fd is None:
             return
         try:
-            self._debug(f"write→pty {repr(data)}")
-            self._write_tracer.record(data)
-            os.write(self.master_fd, data.encode())
+            if self.debug_logger:
+                self._debug(f"write→pty {repr(data)}")
+            if self._write_tracer.sinks:
+                self._write_tracer.record(data)
+            self._write_all(data.encode())
+        except Exception:
+            pass
+
+    def write_bytes(self, data: bytes) -> None:
+        """Write already-encoded bytes to the child's stdin (via PTY).
+
+        For callers that hold constant escape sequences or an encoded
+        payload; skips the per-call ``str.encode``.
+        """
+        if self.master_fd is None:
+            return
+        try:
+            log = bool(self.debug_logger)
+            trace = bool(self._write_tracer.sinks)
+            if log or trace:
+                # Decoded once for whichever of the two is enabled
+                text = data.decode("utf-8", errors="replace")
+                if log:
+                    self._debug(f"write→pty {repr(text)}")
+                if trace:
+                    self._write_tracer.record(text)
+            self._write_all(data)
         except Exception:
             pass
 
     def inject(self, text: str) -> None:
         """Inject a line (presses Enter)."""
-        # Use carriage return to simulate Enter reliably across TUIs
-        self.write(text + "\r")
-
-    def close(self) -> None:
-        # Stop reader loop
-        self._stop_event.set()
+        if self.master_fd is None:
+            return
         try:
-            if self._reader_thread:
-                self._reader_thread.join(timeout=0.5)
+            if self.debug_logger:
+                self._debug(f"write→pty {repr(text + chr(13))}")
+            if self._write_tracer.sinks:
+                self._write_tracer.record(text + "\r")
+            # Use carriage return to simulate Enter reliably across TUIs;
+            # prompt and Enter go out in one writev without a concat copy.
+            self._write_all(text.encode(), _ENTER)
         except Exception:
             pass
 
+    def close(self) -> None:
+        # Stop reading before the master fd is closed
+        self._stop_event.set()
+        if self._pending_scheduled_resize is not None:
+            self._pending_scheduled_resize.cancel()
+            self._pending_scheduled_resize = None
+        if self._pending_exit_check is not None:
+            self._pending_exit_check.cancel()
+            self._pending_exit_check = None
+        reader = self._reader
+        self._reader = None
+        if reader is not None:
+            try:
+                reader.remove(self)
+                if self._owns_reader:
+                    reader.close()
+            except Exception:
+                pass
+
         # Close fds and kill child
         if self.master_fd is not None:
             try:
@@ -275,19 +706,25 @@ class TerminalRunner:
             self.master_fd = None
 
         if self.pid is not None:
-            try:
-                os.kill(self.pid, 9)
-                os.waitpid(self.pid, 0)
-            except Exception:
-                pass
+            with self._reap_lock:
+                if not self._reaped:
+                    try:
+                        os.kill(self.pid, 9)
+                        os.waitpid(self.pid, 0)
+                    except Exception:
+                        pass
+                    self._reaped = True
             self.pid = None
+        self._exited.set()
 
     def is_alive(self) -> bool:
-        if self.pid is None:
-            return False
-        try:
-            # signal 0 doesn't kill; raises if not running
-            os.kill(self.pid, 0)
-            return True
-        except Exception:
-            return False
+        """True until the child's exit is observed; no syscall per call."""
+        return self.pid is not None and not self._exited.is_set()
+
+    def wait_exit(self, timeout: Optional[float] = None) -> bool:
+        """Block until the child's exit is observed (or close() runs).
+
+        Returns False if ``timeout`` seconds pass first. Output the child
+        wrote before exiting has been delivered by the time this returns.
+        """
+        return self._exited.wait(timeout)
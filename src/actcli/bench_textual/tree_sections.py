@@ -4,12 +4,26 @@ These sections implement the TreeSection protocol to build
 specific parts of the Bench navigation tree.
 """
 
+from types import MappingProxyType
 from typing import Optional, Callable
 from textual.widgets.tree import TreeNode
 from .terminal_manager import TerminalManager
 from ..shell.navigation_tree import add_action_node, add_data_node
 
 
+# Node data for the fixed entries, shared across rebuilds. Read-only so a
+# handler can't change it for every later build; handlers only .get() keys.
+_ADD_TERMINAL_DATA = MappingProxyType({"type": "add_terminal"})
+_SESSION_INFO_DATA = MappingProxyType({"type": "session_info"})
+_CONNECT_DATA = MappingProxyType({"type": "connect"})
+_LOG_CATEGORY_NODES = tuple(
+    (cat, MappingProxyType({"type": "log", "cat": cat.lower()}))
+    for cat in ("Events", "Errors", "Output", "Debug")
+)
+_TROUBLESHOOTING_DATA = MappingProxyType({"type": "log", "cat": "troubleshooting"})
+_EXPORT_TROUBLESHOOTING_DATA = MappingProxyType({"type": "action", "id": "export_troubleshooting"})
+
+
 class TerminalsSection:
     """Terminals section - shows active terminals with mute status.
 
@@ -27,6 +41,17 @@ class TerminalsSection:
         """
         self.terminal_manager = terminal_manager
 
+    def fingerprint(self):
+        """Terminal names and mute flags; rebuild only when these change."""
+        return tuple(self.terminal_manager.list_terminal_states())
+
+    def items(self):
+        """Section children as (key, label, data), keyed so rebuilds patch them."""
+        yield "add", "+ Add…", _ADD_TERMINAL_DATA
+        for name, muted in self.terminal_manager.list_terminal_states():
+            label = f"{name} {'[M]' if muted else '[U]'}"
+            yield ("terminal", name), label, {"type": "terminal", "name": name}
+
     def build(self, parent: TreeNode) -> TreeNode:
         """Build the terminals section.
 
@@ -45,17 +70,10 @@ class TerminalsSection:
         """
         section_node = parent.add(self.label)
 
-        # Add "+" action node
-        add_node = section_node.add("+ Add…")
-        add_node.data = {"type": "add_terminal"}
-
-        # Add each terminal with mute indicator
-        for name in self.terminal_manager.list_terminals():
-            state = self.terminal_manager.get_terminal_state(name)
-            if state:
-                mark = "[M]" if state.item.muted else "[U]"
-                node = section_node.add(f"{name} {mark}")
-                node.data = {"type": "terminal", "name": name}
+        # "+" action node, then each terminal with mute indicator
+        for _, label, data in self.items():
+            node = section_node.add(label)
+            node.data = data
 
         return section_node
 
@@ -69,6 +87,10 @@ class SessionsSection:
     label = "Sessions"
     auto_expand = True
 
+    def fingerprint(self):
+        """Static content: built once, then kept across rebuilds."""
+        return self.label
+
     def build(self, parent: TreeNode) -> TreeNode:
         """Build the sessions section.
 
@@ -87,11 +109,11 @@ class SessionsSection:
 
         # Current session info
         cur = section_node.add("Current session")
-        cur.data = {"type": "session_info"}
+        cur.data = _SESSION_INFO_DATA
 
         # Connect action
         connect = section_node.add("Connect…")
-        connect.data = {"type": "connect"}
+        connect.data = _CONNECT_DATA
 
         return section_node
 
@@ -113,6 +135,18 @@ class SettingsSection:
         """
         self.get_mirror_state = get_mirror_state
 
+    def fingerprint(self):
+        """Only the mirror toggle label varies."""
+        return self._mirror_checked()
+
+    def _mirror_checked(self) -> bool:
+        if self.get_mirror_state:
+            try:
+                return bool(self.get_mirror_state())
+            except Exception:
+                pass
+        return False
+
     def build(self, parent: TreeNode) -> TreeNode:
         """Build the settings section.
 
@@ -136,13 +170,7 @@ class SettingsSection:
         add_action_node(section_node, "Unmute All", "unmute_all")
 
         # Mirror toggle with current state
-        mirror_checked = False
-        if self.get_mirror_state:
-            try:
-                mirror_checked = self.get_mirror_state()
-            except Exception:
-                pass
-
+        mirror_checked = self._mirror_checked()
         mirror_label = f"Mirror to viewer {'[X]' if mirror_checked else '[ ]'}"
         add_action_node(section_node, mirror_label, "toggle_mirror")
 
@@ -161,6 +189,10 @@ class LogsSection:
     label = "Logs"
     auto_expand = True
 
+    def fingerprint(self):
+        """Static content: built once, then kept across rebuilds."""
+        return self.label
+
     def build(self, parent: TreeNode) -> TreeNode:
         """Build the logs section.
 
@@ -182,16 +214,16 @@ class LogsSection:
         section_node = parent.add(self.label)
 
         # Log category views
-        for cat in ("Events", "Errors", "Output", "Debug"):
+        for cat, data in _LOG_CATEGORY_NODES:
             n = section_node.add(cat)
-            n.data = {"type": "log", "cat": cat.lower()}
+            n.data = data
 
         # Troubleshooting pack submenu
         tpack = section_node.add("Troubleshooting Pack")
-        tpack.data = {"type": "log", "cat": "troubleshooting"}
+        tpack.data = _TROUBLESHOOTING_DATA
 
         tpack_save = tpack.add("Save to file")
-        tpack_save.data = {"type": "action", "id": "export_troubleshooting"}
+        tpack_save.data = _EXPORT_TROUBLESHOOTING_DATA
 
         # Expand troubleshooting pack submenu
         try:
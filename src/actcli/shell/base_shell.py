@@ -8,7 +8,7 @@ Provides a reusable 3-panel layout with:
 Products extend this class and implement the protocols to customize behavior.
 """
 
-from typing import Protocol, Iterator, runtime_checkable
+from typing import Protocol, Iterator
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
@@ -17,7 +17,6 @@ from .navigation_tree import NavigationTree
 from .detail_view import DetailView
 
 
-@runtime_checkable
 class NavigationProvider(Protocol):
     """Protocol for providing navigation tree structure.
 
@@ -34,7 +33,6 @@ class NavigationProvider(Protocol):
         ...
 
 
-@runtime_checkable
 class DetailViewProvider(Protocol):
     """Protocol for providing the main detail view widget(s).
 
@@ -51,7 +49,6 @@ class DetailViewProvider(Protocol):
         ...
 
 
-@runtime_checkable
 class ControlPanelProvider(Protocol):
     """Protocol for providing control panel widgets.
 
@@ -81,12 +78,28 @@ class ActCLIShell(App):
     # Available themes - subclasses can override
     THEMES = ["ledger", "analyst", "seminar"]
 
+    # theme name -> CSS class, rebuilt per subclass from its THEMES
+    _theme_classes = {theme: f"theme-{theme}" for theme in THEMES}
+
     # Default theme - subclasses can override
     DEFAULT_THEME = "ledger"
 
+    # Fixed sidebar/status text - subclasses can override these instead of
+    # the get_* methods below when the text doesn't depend on state
+    BRAND_TEXT = "ActCLI"
+    THEME_HINTS = "F1: Ledger • F2: Analyst • F3: Seminar"
+    INITIAL_STATUS = "Ready"
+
     # CSS file path - subclasses can override to add additional styles
     CSS_PATH = None
 
+    # Which provider protocols the class implements, detected by method
+    # presence once per subclass in __init_subclass__. The protocols are
+    # for type checkers only; they are not runtime-checkable.
+    _provides_navigation = False
+    _provides_detail_view = False
+    _provides_control_panel = False
+
     BINDINGS = [
         Binding("f1", "switch_theme('ledger')", "Ledger theme"),
         Binding("f2", "switch_theme('analyst')", "Analyst theme"),
@@ -94,6 +107,13 @@ class ActCLIShell(App):
         Binding("q", "quit", "Quit"),
     ]
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._provides_navigation = callable(getattr(cls, "build_navigation_tree", None))
+        cls._provides_detail_view = callable(getattr(cls, "compose_detail_view", None))
+        cls._provides_control_panel = callable(getattr(cls, "compose_control_panel", None))
+        cls._theme_classes = {theme: f"theme-{theme}" for theme in cls.THEMES}
+
     def __init__(self, *args, **kwargs):
         """Initialize the shell."""
         super().__init__(*args, **kwargs)
@@ -143,11 +163,11 @@ class ActCLIShell(App):
                 with self.detail_view:
                     # DetailView.compose() yields status line first
                     # Then we yield the content widgets
-                    if isinstance(self, DetailViewProvider):
+                    if self._provides_detail_view:
                         yield from self.compose_detail_view()
 
                 # Control panel (from subclass) - below detail view
-                if isinstance(self, ControlPanelProvider):
+                if self._provides_control_panel:
                     with Horizontal(id="control"):
                         yield from self.compose_control_panel()
 
@@ -157,10 +177,10 @@ class ActCLIShell(App):
         Applies the default theme and builds the navigation tree.
         """
         # Apply default theme class
-        self.add_class(f"theme-{self._active_theme}")
+        self.add_class(self._theme_class(self._active_theme))
 
         # Build navigation tree if provider implemented (guard against double mount)
-        if isinstance(self, NavigationProvider) and self.nav_tree and not self._nav_tree_initialized:
+        if self._provides_navigation and self.nav_tree and not self._nav_tree_initialized:
             self._nav_tree_initialized = True
             self.build_navigation_tree(self.nav_tree)
             # Trigger initial tree build after configuration
@@ -174,7 +194,7 @@ class ActCLIShell(App):
         Returns:
             Brand text string (e.g., "ActCLI • ProductName")
         """
-        return "ActCLI"
+        return self.BRAND_TEXT
 
     def get_theme_hints(self) -> str:
         """Get the theme hint text for the sidebar.
@@ -182,7 +202,7 @@ class ActCLIShell(App):
         Returns:
             Theme hint string showing available themes
         """
-        return "F1: Ledger • F2: Analyst • F3: Seminar"
+        return self.THEME_HINTS
 
     def get_initial_status(self) -> str:
         """Get the initial status line text.
@@ -192,7 +212,7 @@ class ActCLIShell(App):
         Returns:
             Initial status text
         """
-        return "Ready"
+        return self.INITIAL_STATUS
 
     def action_switch_theme(self, theme_name: str) -> None:
         """Switch to a different theme.
@@ -200,12 +220,19 @@ class ActCLIShell(App):
         Args:
             theme_name: Name of the theme (ledger, analyst, seminar)
         """
-        # Remove old theme class
-        self.remove_class(f"theme-{self._active_theme}")
+        # Re-selecting the active theme would only force a style recompute
+        if theme_name == self._active_theme:
+            return
 
-        # Apply new theme
+        # Swap old theme class for the new one in a single class update, so
+        # styles are recomputed once rather than after each of remove/add
+        old_class = self._theme_class(self._active_theme)
         self._active_theme = theme_name
-        self.add_class(f"theme-{theme_name}")
+        self.set_classes((self.classes - {old_class}) | {self._theme_class(theme_name)})
+
+    def _theme_class(self, theme_name: str) -> str:
+        """Return the CSS class for a theme (precomputed for THEMES)."""
+        return self._theme_classes.get(theme_name) or f"theme-{theme_name}"
 
     def update_status(self, text: str) -> None:
         """Update the status line text.
@@ -5,6 +5,7 @@ This widget encapsulates the upper-right panel that displays:
 - Main content area (terminals, logs, or other views)
 """
 
+import asyncio
 from typing import Optional
 from textual.app import ComposeResult
 from textual.containers import Vertical
@@ -80,16 +81,20 @@ class DetailView(Vertical):
             widget: Widget to display in the content area
             clear_existing: If True, remove existing content first
         """
-        # Remove non-status children if clearing
-        if clear_existing:
-            for child in list(self.children):
-                if child != self.status_line:
-                    await child.remove()
-
-        await self.mount(widget)
+        # Swap content inside one batch so the screen repaints once
+        with self.app.batch_update():
+            if clear_existing:
+                await self._remove_content()
+            await self.mount(widget)
 
     async def clear_content(self) -> None:
         """Remove all non-status content from the detail view."""
-        for child in list(self.children):
-            if child != self.status_line:
-                await child.remove()
+        with self.app.batch_update():
+            await self._remove_content()
+
+    async def _remove_content(self) -> None:
+        """Remove every non-status child, awaiting the removals together."""
+        status = self.status_line
+        removals = [child.remove() for child in list(self.children) if child is not status]
+        if removals:
+            await asyncio.gather(*removals)
@@ -4,8 +4,10 @@ This widget encapsulates both tree structure building and event handling,
 keeping navigation logic separate from the main app.
 """
 
+import time
 import traceback
-from typing import Protocol, Callable, Dict, List, Any, Optional, runtime_checkable
+from collections import deque
+from typing import Protocol, Callable, Deque, Dict, Hashable, Iterable, List, Any, Optional, Tuple, runtime_checkable
 from textual.widgets import Tree
 from textual.widgets.tree import TreeNode
 
@@ -16,6 +18,17 @@ class TreeSection(Protocol):
 
     Sections are responsible for building their portion of the navigation tree.
     They can be static (e.g., Settings) or dynamic (e.g., Terminals list).
+
+    A section may also define ``fingerprint() -> Hashable``. When it returns
+    the same value as at the previous rebuild, the section's existing nodes
+    are kept instead of being rebuilt; sections without it always rebuild.
+
+    A section whose children are a flat list may further define
+    ``items() -> Iterable[(key, label, data)]`` describing the children
+    ``build()`` creates, in the same order. The tree then adds the section
+    node (``label``) and its children itself, without calling ``build()``,
+    and on a changed rebuild updates those children by key (add new,
+    remove gone, relabel) instead of rebuilding the whole section.
     """
 
     label: str
@@ -36,6 +49,73 @@ class TreeSection(Protocol):
         ...
 
 
+class _InsertionPoint:
+    """Stand-in parent handed to ``TreeSection.build`` during a rebuild.
+
+    Forwards ``add`` and ``add_leaf`` to the real parent, placing the
+    section's node right after the previous section's (kept) node so section
+    order is preserved. Nothing else is forwarded, so a ``build()`` that uses
+    other parent APIs fails loudly instead of misplacing its node.
+    """
+
+    def __init__(self, parent: TreeNode, after: Optional[TreeNode]):
+        self._parent = parent
+        self._after = after
+
+    def add(self, label: Any, data: Any = None, **kwargs: Any) -> TreeNode:
+        return self._place(self._parent.add, label, data, kwargs)
+
+    def add_leaf(self, label: Any, data: Any = None, **kwargs: Any) -> TreeNode:
+        return self._place(self._parent.add_leaf, label, data, kwargs)
+
+    def _place(
+        self, add: Callable[..., TreeNode], label: Any, data: Any, kwargs: Dict[str, Any]
+    ) -> TreeNode:
+        if self._after is not None:
+            kwargs.setdefault("after", self._after)
+        elif self._parent.children:
+            kwargs.setdefault("before", self._parent.children[0])
+        node = add(label, data, **kwargs)
+        self._after = node
+        return node
+
+
+# Fingerprint for sections that don't define one: never equal, always rebuilt
+_NO_FINGERPRINT = object()
+
+SectionItem = Tuple[Hashable, str, Any]
+
+
+def _sync_items(
+    node: TreeNode, items: Iterable[SectionItem], existing: Dict[Hashable, TreeNode]
+) -> Dict[Hashable, TreeNode]:
+    """Make ``node``'s children match ``items`` by key; returns key -> child.
+
+    Kept children are relabelled/re-tagged in place; new ones are inserted
+    after the preceding item. ``existing`` is consumed.
+    """
+    synced: Dict[Hashable, TreeNode] = {}
+    after: Optional[TreeNode] = None
+    for key, label, data in items:
+        child = existing.pop(key, None)
+        if child is None:
+            if after is not None:
+                child = node.add(label, data, after=after)
+            elif node.children:
+                child = node.add(label, data, before=node.children[0])
+            else:
+                child = node.add(label, data)
+        else:
+            if str(child.label) != label:
+                child.set_label(label)
+            child.data = data
+        synced[key] = child
+        after = child
+    for child in existing.values():
+        child.remove()
+    return synced
+
+
 class NavigationTree(Tree):
     """Smart navigation tree that manages sections and handles events.
 
@@ -60,14 +140,25 @@ class NavigationTree(Tree):
         # Registered sections (in order)
         self._sections: List[TreeSection] = []
 
+        # Frozen view of _sections with each section's optional
+        # fingerprint/items methods looked up once; rebuilt lazily after
+        # register_section() so setup-time registration stays cheap
+        self._section_plan: Optional[Tuple[Tuple[TreeSection, Any, Any], ...]] = None
+
         # Action handlers: action_id -> callable
         self._action_handlers: Dict[str, Callable[[], None]] = {}
 
         # Node selection handlers: node_type -> callable(node_data)
         self._node_handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {}
 
-        # Diagnostics: track rebuild events to detect duplicates
-        self.rebuild_history: List[Dict[str, Any]] = []
+        # Per section (by id): (fingerprint, section node, key -> child node
+        # for sections with items()) from the last rebuild
+        self._section_nodes: Dict[
+            int, Tuple[Hashable, TreeNode, Optional[Dict[Hashable, TreeNode]]]
+        ] = {}
+
+        # Diagnostics: last 20 rebuild events, to detect duplicates
+        self.rebuild_history: Deque[Dict[str, Any]] = deque(maxlen=20)
 
     def register_section(self, section: TreeSection) -> None:
         """Register a tree section provider.
@@ -78,6 +169,7 @@ class NavigationTree(Tree):
             section: The section provider to register
         """
         self._sections.append(section)
+        self._section_plan = None
 
     def register_action(self, action_id: str, handler: Callable[[], None]) -> None:
         """Register an action handler for tree actions.
@@ -104,30 +196,59 @@ class NavigationTree(Tree):
         self._node_handlers[node_type] = handler
 
     def rebuild(self) -> None:
-        """Rebuild the entire tree from registered sections.
+        """Rebuild the tree from registered sections.
 
-        This clears all existing nodes and rebuilds from scratch.
+        Sections whose ``fingerprint()`` is unchanged keep their nodes;
+        changed sections with ``items()`` are updated child-by-child; every
+        other section's nodes are removed and built again in place.
         Call this when dynamic content changes (e.g., terminals added/removed).
         """
-        # Track this rebuild for diagnostics (FAST - no traceback extraction)
-        from datetime import datetime
-
+        # Track this rebuild for diagnostics (FAST - no traceback extraction).
+        # The timestamp is epoch nanoseconds; diagnostics format it on export.
         rebuild_event = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": time.time_ns(),
             "section_count": len(self._sections),
         }
         self.rebuild_history.append(rebuild_event)
 
-        # Keep only last 20 rebuild events
-        if len(self.rebuild_history) > 20:
-            self.rebuild_history = self.rebuild_history[-20:]
-
-        # Clear existing tree - use clear() instead of manual removal
-        self.root.remove_children()
-
-        # Build each section
-        for section in self._sections:
-            section_node = section.build(self.root)
+        plan = self._section_plan
+        if plan is None:
+            plan = self._section_plan = tuple(
+                (section, getattr(section, "fingerprint", None), getattr(section, "items", None))
+                for section in self._sections
+            )
+
+        previous_nodes = self._section_nodes
+        self._section_nodes = {}
+        placed: Optional[TreeNode] = None
+        for section, fingerprint, items in plan:
+            fp = fingerprint() if fingerprint is not None else _NO_FINGERPRINT
+            previous = previous_nodes.pop(id(section), None)
+            if previous is not None:
+                old_fp, section_node, children = previous
+                if fp is not _NO_FINGERPRINT and old_fp == fp:
+                    # Unchanged: keep the nodes (and their expansion state)
+                    self._section_nodes[id(section)] = previous
+                    placed = section_node
+                    continue
+                if children is not None and items is not None:
+                    # Changed flat section: patch its children by key
+                    children = _sync_items(section_node, items(), children)
+                    self._section_nodes[id(section)] = (fp, section_node, children)
+                    placed = section_node
+                    continue
+                section_node.remove()
+
+            insertion_point = _InsertionPoint(self.root, placed)
+            children = None
+            if items is not None:
+                # Flat section: key its children as they are created
+                section_node = insertion_point.add(section.label)
+                children = _sync_items(section_node, items(), {})
+            else:
+                section_node = section.build(insertion_point)
+            self._section_nodes[id(section)] = (fp, section_node, children)
+            placed = section_node
 
             # Auto-expand if requested
             if section.auto_expand:
@@ -136,6 +257,10 @@ class NavigationTree(Tree):
                 except Exception:
                     pass
 
+        # Sections no longer registered
+        for _, node, _ in previous_nodes.values():
+            node.remove()
+
         # Always expand root
         try:
             self.root.expand()
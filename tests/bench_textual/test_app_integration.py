@@ -47,6 +47,38 @@ class TestAppInstantiation:
         assert "f2" in binding_keys
         assert "f3" in binding_keys
 
+    def test_bench_branding(self):
+        """Bench sets its sidebar/status text via class attributes."""
+        app = BenchTextualApp()
+        assert app.get_brand_text() == "ActCLI • Bench"
+        assert app.get_initial_status() == "Terminal"
+        assert app.get_theme_hints().startswith("F1: Ledger")
+
+    def test_provider_flags_match_protocols(self):
+        """Provider flags are detected from the methods a subclass defines."""
+        from src.actcli.shell.base_shell import ActCLIShell
+
+        app = BenchTextualApp()
+        assert app._provides_navigation
+        assert app._provides_detail_view
+        assert app._provides_control_panel
+
+        class BareShell(ActCLIShell):
+            pass
+
+        assert not BareShell._provides_navigation
+        assert not BareShell._provides_detail_view
+        assert not BareShell._provides_control_panel
+
+    async def test_unmount_shuts_down_terminal_manager(self):
+        """Leaving the app stops the manager's output worker and PTY reader."""
+        app = BenchTextualApp()
+        calls = []
+        async with app.run_test():
+            app.terminal_manager.shutdown = lambda: calls.append("shutdown")
+
+        assert calls == ["shutdown"]
+
     async def test_app_can_mount(self):
         """Test that app can mount without errors."""
         async with BenchTextualApp().run_test() as pilot:
@@ -95,6 +127,31 @@ class TestThemeSwitching:
             # Should have seminar theme class
             assert "theme-seminar" in app.classes
 
+    async def test_reselecting_active_theme_keeps_classes(self):
+        """Switching to the active theme is a no-op."""
+        async with BenchTextualApp().run_test() as pilot:
+            app = pilot.app
+            await pilot.press("f2")
+            await pilot.press("f2")
+            await pilot.pause()
+
+            assert "theme-analyst" in app.classes
+            assert "theme-ledger" not in app.classes
+
+    async def test_theme_switch_updates_styles_once(self):
+        """Swapping theme classes triggers a single style update."""
+        async with BenchTextualApp().run_test() as pilot:
+            app = pilot.app
+            updates = []
+            original = app.update_node_styles
+            app.update_node_styles = lambda *a, **kw: (updates.append(1), original(*a, **kw))
+
+            app.action_switch_theme("seminar")
+
+            assert len(updates) == 1
+            assert "theme-seminar" in app.classes
+            assert "theme-ledger" not in app.classes
+
 
 class TestNavigationTree:
     """Test navigation tree building."""
@@ -117,6 +174,139 @@ class TestNavigationTree:
             assert "Settings" in labels
             assert "Logs" in labels
 
+    async def test_rebuild_history_keeps_last_20(self):
+        """Rebuild history is bounded without reallocating the container."""
+        async with BenchTextualApp().run_test() as pilot:
+            nav_tree = pilot.app.query_one("#nav-tree", Tree)
+            history = nav_tree.rebuild_history
+            for _ in range(25):
+                nav_tree.rebuild()
+
+            assert nav_tree.rebuild_history is history
+            assert len(history) == 20
+            assert all(isinstance(e["timestamp"], int) for e in history)
+
+    async def test_unchanged_sections_are_kept_on_rebuild(self):
+        """Only sections whose fingerprint changed are rebuilt, in place."""
+        from src.actcli.bench_textual.terminal_manager import TerminalState
+        from src.actcli.bench_textual.term_emulator import EmulatedTerminal
+
+        class FakeRunner:
+            muted = True
+
+        async with BenchTextualApp().run_test() as pilot:
+            app = pilot.app
+            nav_tree = app.query_one("#nav-tree", Tree)
+            before = list(nav_tree.root.children)
+
+            nav_tree.rebuild()
+            assert list(nav_tree.root.children) == before
+
+            app.terminal_manager.terminals["demo"] = TerminalState(
+                item=FakeRunner(), emulator=EmulatedTerminal(cols=80, rows=24)
+            )
+            nav_tree.rebuild()
+            after = list(nav_tree.root.children)
+
+            assert after == before
+            terminals = after[0]
+            add_node = terminals.children[0]
+            assert [str(c.label) for c in terminals.children] == ["+ Add…", "demo [M]"]
+
+            # Unmute and add another: existing children are patched, not rebuilt
+            demo_node = terminals.children[1]
+            app.terminal_manager.terminals["demo"].item.muted = False
+            app.terminal_manager.terminals["next"] = TerminalState(
+                item=FakeRunner(), emulator=EmulatedTerminal(cols=80, rows=24)
+            )
+            nav_tree.rebuild()
+            assert [str(c.label) for c in terminals.children] == [
+                "+ Add…", "demo [U]", "next [M]"
+            ]
+            assert terminals.children[0] is add_node
+            assert terminals.children[1] is demo_node
+
+            del app.terminal_manager.terminals["demo"]
+            nav_tree.rebuild()
+            assert [str(c.label) for c in terminals.children] == ["+ Add…", "next [M]"]
+
+    async def test_section_registered_after_rebuild_is_built(self):
+        """Registering a section refreshes the frozen section plan."""
+        from src.actcli.bench_textual.tree_sections import LogsSection
+
+        async with BenchTextualApp().run_test() as pilot:
+            nav_tree = pilot.app.query_one("#nav-tree", Tree)
+            before = list(nav_tree.root.children)
+
+            nav_tree.register_section(LogsSection())
+            nav_tree.rebuild()
+            after = list(nav_tree.root.children)
+
+            assert after[:len(before)] == before
+            assert len(after) == len(before) + 1
+            assert str(after[-1].label) == "Logs"
+
+    async def test_items_section_children_are_keyed_from_one_items_call(self):
+        """First build creates keyed children from a single items() result."""
+
+        class ItemsSection:
+            label = "Items"
+            auto_expand = False
+
+            def __init__(self):
+                self.entries = ["a", "b"]
+                self.items_calls = 0
+
+            def fingerprint(self):
+                return tuple(self.entries)
+
+            def items(self):
+                self.items_calls += 1
+                for entry in self.entries:
+                    yield entry, entry.upper(), {"type": "item", "name": entry}
+
+            def build(self, parent):
+                raise AssertionError("tree builds items() sections itself")
+
+        async with BenchTextualApp().run_test() as pilot:
+            nav_tree = pilot.app.query_one("#nav-tree", Tree)
+            section = ItemsSection()
+            nav_tree.register_section(section)
+            nav_tree.rebuild()
+
+            section_node = nav_tree.root.children[-1]
+            assert str(section_node.label) == "Items"
+            assert [str(c.label) for c in section_node.children] == ["A", "B"]
+            assert section.items_calls == 1
+
+            b_node = section_node.children[1]
+            section.entries = ["b", "c"]
+            nav_tree.rebuild()
+            assert [str(c.label) for c in section_node.children] == ["B", "C"]
+            assert section_node.children[0] is b_node
+
+    async def test_rebuilt_leaf_section_keeps_its_position(self):
+        """A section built with add_leaf is re-placed in order on rebuild."""
+        from src.actcli.bench_textual.tree_sections import LogsSection
+
+        class LeafSection:
+            label = "Leaf"
+            auto_expand = False
+
+            def build(self, parent):
+                return parent.add_leaf(self.label)
+
+        async with BenchTextualApp().run_test() as pilot:
+            nav_tree = pilot.app.query_one("#nav-tree", Tree)
+            nav_tree.register_section(LeafSection())
+            nav_tree.register_section(LogsSection())
+            nav_tree.rebuild()
+            nav_tree.rebuild()
+
+            labels = [str(child.label) for child in nav_tree.root.children]
+            assert labels[-2:] == ["Leaf", "Logs"]
+            assert not nav_tree.root.children[-2].allow_expand
+
     async def test_terminals_section_has_add_node(self):
         """Test that Terminals section has '+ Add…' node."""
         async with BenchTextualApp().run_test() as pilot:
@@ -167,5 +357,81 @@ class TestStatusLine:
             assert status is not None
 
 
+class TestDetailView:
+    """Test swapping content in the detail panel."""
+
+    async def test_set_and_clear_content_keep_status_line(self):
+        """Content swaps remove every other child but the status line."""
+        async with BenchTextualApp().run_test() as pilot:
+            detail = pilot.app.detail_view
+            status = detail.status_line
+            await detail.set_content(Static("extra"), clear_existing=False)
+            assert len(detail.children) == 3
+
+            replacement = Static("replacement")
+            await detail.set_content(replacement)
+            assert list(detail.children) == [status, replacement]
+
+            await detail.clear_content()
+            assert list(detail.children) == [status]
+
+
+class TestResizeDebounce:
+    """Test that bursts of resize events collapse into one sync."""
+
+    async def test_resize_burst_syncs_once(self):
+        async with BenchTextualApp().run_test() as pilot:
+            app = pilot.app
+            synced = []
+            app._sync_terminal_size = synced.append
+            app._schedule_terminal_resizes = lambda name: None
+
+            for _ in range(30):
+                app._request_terminal_resize("t1")
+            await pilot.pause(0.1)
+
+            assert synced == ["t1"]
+            assert app._resize_flush_timer is None
+
+
+class TestOutputRenderBatching:
+    """Test that bursts of output callbacks render the active terminal once."""
+
+    async def test_output_burst_renders_once(self):
+        import threading
+        from src.actcli.bench_textual.terminal_manager import TerminalState
+        from src.actcli.bench_textual.term_emulator import EmulatedTerminal
+
+        class FakeRunner:
+            muted = True
+
+        async with BenchTextualApp().run_test() as pilot:
+            app = pilot.app
+            state = TerminalState(item=FakeRunner(), emulator=EmulatedTerminal(cols=80, rows=24))
+            app.terminal_manager.terminals["demo"] = state
+            app.active_terminal = "demo"
+            rendered = []
+            app._set_terminal_text = rendered.append
+
+            def burst():
+                for i in range(30):
+                    state.emulator.feed(f"{i} ")
+                    app._on_terminal_output("demo", f"{i} ")
+
+            # Output callbacks arrive on the manager's worker thread
+            worker = threading.Thread(target=burst)
+            worker.start()
+            worker.join()
+            await pilot.pause()
+
+            assert len(rendered) == 1
+            assert "29" in rendered[0]
+            assert not app._output_render_pending
+
+            app._on_terminal_output("demo", "")
+            await pilot.pause()
+            assert len(rendered) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
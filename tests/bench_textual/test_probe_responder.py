@@ -77,6 +77,15 @@ class TestTerminalProbeResponder:
         response = responder.response_for_text("\x1b[6n", ZeroEmulator())
         assert response == "\x1b[1;1R"
 
+    def test_batched_emulator_output_is_flushed_first(self):
+        from src.actcli.bench_textual.term_emulator import EmulatedTerminal
+
+        emu = EmulatedTerminal(cols=20, rows=4)
+        emu.feed("\x1b[2;5Hxy")
+
+        responder = TerminalProbeResponder()
+        assert responder.response_for_text("\x1b[6n", emu) == "\x1b[2;7R"
+
     def test_malformed_emulator_does_not_raise(self):
         class BadEmulator:
             pass
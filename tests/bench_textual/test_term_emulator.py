@@ -11,14 +11,24 @@ Terminology (to prevent confusion):
 - PTY uses: (rows, cols) order in winsize struct
 """
 
+import sys
+
 import pytest
-from src.actcli.bench_textual.term_emulator import EmulatedTerminal
+from src.actcli.bench_textual.term_emulator import EmulatedTerminal, _strip_ansi
 
 
 class TestEmulatorDimensions:
     """Test suite for dimension handling - the source of our width bug!"""
 
-    def test_pyte_dimension_order_on_init(self):
+    @pytest.mark.parametrize(
+        "cols,rows",
+        [
+            (175, 39),  # wide: the intended state
+            (39, 175),  # narrow: the swapped state the bug produced
+            (80, 24),
+        ],
+    )
+    def test_pyte_dimension_order_on_init(self, cols, rows):
         """REGRESSION: Ensure pyte Screen is created with correct dimension order.
 
         Bug history: We were calling pyte.Screen(cols, rows) which pyte
@@ -30,20 +40,26 @@ class TestEmulatorDimensions:
         constructor is (columns, lines), so if we used positional args wrong,
         we'd get a 39-column screen instead of 175!
         """
-        # Create emulator with: 175 cols (WIDTH) x 39 rows (HEIGHT)
-        emu = EmulatedTerminal(cols=175, rows=39)
+        emu = EmulatedTerminal(cols=cols, rows=rows)
 
         # Verify our internal tracking
-        assert emu.cols == 175, "Emulator should track 175 columns (width)"
-        assert emu.rows == 39, "Emulator should track 39 rows (height)"
+        assert (emu.cols, emu.rows) == (cols, rows), "Emulator should track (width, height)"
 
         # CRITICAL: Verify pyte's internal state matches
         if emu._use_pyte:
-            assert emu._screen.columns == 175, "pyte Screen should have 175 columns (width)"
-            assert emu._screen.lines == 39, "pyte Screen should have 39 lines (height)"
+            screen = emu._screen
+            assert (screen.columns, screen.lines) == (cols, rows), \
+                "pyte Screen should be (columns=width, lines=height)"
             # If this fails, we've reintroduced the dimension swap bug!
 
-    def test_pyte_dimension_order_on_resize(self):
+    @pytest.mark.parametrize(
+        "sizes",
+        [
+            [(175, 39)],  # to a wide terminal
+            [(120, 30), (175, 39), (100, 20)],  # swaps must not accumulate
+        ],
+    )
+    def test_pyte_dimension_order_on_resize(self, sizes):
         """REGRESSION: Ensure resize() maintains correct dimension order.
 
         Bug history: resize() was calling screen.resize(cols, rows) but
@@ -51,58 +67,30 @@ class TestEmulatorDimensions:
         This caused a 175x39 terminal to become 39x175 on resize.
         """
         emu = EmulatedTerminal(cols=80, rows=24)
-
-        # Resize to wide terminal: 175 cols (WIDTH) x 39 rows (HEIGHT)
-        emu.resize(cols=175, rows=39)
+        for cols, rows in sizes:
+            emu.resize(cols=cols, rows=rows)
 
         # Verify internal tracking updated
-        assert emu.cols == 175
-        assert emu.rows == 39
+        assert (emu.cols, emu.rows) == (cols, rows)
 
         # CRITICAL: Verify pyte screen updated correctly
         if emu._use_pyte:
-            assert emu._screen.columns == 175, "After resize, pyte should have 175 columns"
-            assert emu._screen.lines == 39, "After resize, pyte should have 39 lines"
+            screen = emu._screen
+            assert (screen.columns, screen.lines) == (cols, rows), \
+                "After resize, pyte should be (columns=width, lines=height)"
             # If this fails, resize() is swapping dimensions!
 
-    def test_multiple_resizes_maintain_order(self):
-        """Ensure multiple resizes don't accumulate dimension swap errors."""
-        emu = EmulatedTerminal(cols=80, rows=24)
-
-        # Resize sequence
-        emu.resize(cols=120, rows=30)
-        emu.resize(cols=175, rows=39)
-        emu.resize(cols=100, rows=20)
-
-        if emu._use_pyte:
-            assert emu._screen.columns == 100
-            assert emu._screen.lines == 20
-
-    def test_narrow_terminal_dimensions(self):
-        """Test that narrow terminals (like the bug) work correctly."""
-        # This was the buggy state: 39 cols x 175 rows (swapped!)
-        emu = EmulatedTerminal(cols=39, rows=175)
-
-        if emu._use_pyte:
-            assert emu._screen.columns == 39, "Should be 39 columns wide (narrow)"
-            assert emu._screen.lines == 175, "Should be 175 lines tall (very tall)"
-
-    def test_wide_terminal_dimensions(self):
-        """Test wide terminals (the intended state)."""
-        # This was the intended state: 175 cols x 39 rows
-        emu = EmulatedTerminal(cols=175, rows=39)
-
-        if emu._use_pyte:
-            assert emu._screen.columns == 175, "Should be 175 columns wide (wide)"
-            assert emu._screen.lines == 39, "Should be 39 lines tall (normal height)"
-
 
 class TestEmulatorOutput:
     """Test emulator text output and rendering."""
 
-    def test_simple_text_output(self):
+    @pytest.fixture
+    def emu(self):
+        """A fresh 80x24 emulator per test (construction is cheap)."""
+        return EmulatedTerminal(cols=80, rows=24)
+
+    def test_simple_text_output(self, emu):
         """Ensure emulator captures and displays simple text."""
-        emu = EmulatedTerminal(cols=80, rows=24)
         emu.feed("Hello World\n")
 
         output = emu.text()
@@ -125,18 +113,15 @@ class TestEmulatorOutput:
         assert len(first_line) <= 20 or not emu._use_pyte, \
             "Output should respect width constraint"
 
-    def test_emulator_mode_property(self):
+    def test_emulator_mode_property(self, emu):
         """Verify mode property reports correct emulator type."""
-        emu = EmulatedTerminal(cols=80, rows=24)
-
         # Should be "pyte" if pyte is available, "plain" otherwise
         mode = emu.mode
         assert mode in ("pyte", "plain")
         assert mode == ("pyte" if emu._use_pyte else "plain")
 
-    def test_text_with_cursor(self):
+    def test_text_with_cursor(self, emu):
         """Test that cursor rendering works."""
-        emu = EmulatedTerminal(cols=80, rows=24)
         emu.feed("Test")
 
         # Should be able to get text with cursor
@@ -147,10 +132,8 @@ class TestEmulatorOutput:
         text_without_cursor = emu.text_with_cursor(show=False)
         assert isinstance(text_without_cursor, str)
 
-    def test_ansi_color_codes(self):
+    def test_ansi_color_codes(self, emu):
         """Test that ANSI color codes are processed."""
-        emu = EmulatedTerminal(cols=80, rows=24)
-
         # Feed text with ANSI color codes
         emu.feed("\x1b[31mRed Text\x1b[0m\n")
 
@@ -159,6 +142,53 @@ class TestEmulatorOutput:
         # Plain mode just strips them
         assert isinstance(output, str)
 
+    def test_str_and_bytes_feed_render_identically(self):
+        """Text input bypasses the byte decoder but must render the same."""
+        payload = "\x1b[1mnaïve 日本\x1b[0m\r\nline two"
+        from_str = EmulatedTerminal(cols=40, rows=4)
+        from_bytes = EmulatedTerminal(cols=40, rows=4)
+
+        from_str.feed(payload)
+        from_bytes.feed(payload.encode("utf-8"))
+
+        assert from_str.text() == from_bytes.text()
+        assert "naïve 日本" in from_str.text()
+
+    def test_text_feeds_are_batched_until_read(self):
+        """Text chunks reach pyte together when the screen is read."""
+        emu = EmulatedTerminal(cols=20, rows=4)
+        emu.feed("ab")
+        emu.feed("\x1b[3")
+        emu.feed("1mcd")
+
+        assert emu._screen.cursor.x == 0
+        assert emu.text().splitlines()[0].rstrip() == "abcd"
+        assert emu._screen.cursor.x == 4
+
+    def test_bytes_feed_keeps_order_with_batched_text(self):
+        emu = EmulatedTerminal(cols=20, rows=4)
+        emu.feed("one ")
+        emu.feed(b"two")
+
+        assert emu.text_with_cursor(show=False).splitlines()[0].rstrip() == "one two"
+
+    def test_resize_flushes_batched_text(self):
+        emu = EmulatedTerminal(cols=20, rows=4)
+        emu.feed("hello")
+        emu.resize(cols=30, rows=5)
+
+        assert emu._screen.cursor.x == 5
+
+    def test_debug_previews_long_lines_truncated(self):
+        """Debug logging of a long cursor line only previews its start."""
+        messages = []
+        emu = EmulatedTerminal(cols=300, rows=4, debug_logger=messages.append)
+        emu.feed("z" * 250)
+        emu.text_with_cursor()
+
+        assert f"[text_with_cursor] line_bytes(truncated)={b'z' * 200}" in messages
+        assert f"[_index_from_column] raw_line={'z' * 200!r}" in messages
+
 
 class TestEmulatorEdgeCases:
     """Test edge cases and error handling."""
@@ -177,15 +207,25 @@ class TestEmulatorEdgeCases:
 
     def test_very_large_dimensions(self):
         """Test that very large dimensions don't cause issues."""
-        emu = EmulatedTerminal(cols=1000, rows=1000)
-        assert emu.cols == 1000
-        assert emu.rows == 1000
+        # Well past any real window; a 1000x1000 screen only added a
+        # second of allocation without covering another code path
+        emu = EmulatedTerminal(cols=400, rows=200)
+        assert (emu.cols, emu.rows) == (400, 200)
 
         # Should be able to feed text
         emu.feed("Test\n")
         output = emu.text()
         assert isinstance(output, str)
 
+    @pytest.mark.slow
+    def test_extreme_dimensions(self):
+        """Test a 1000x1000 screen (about a second of pyte allocation)."""
+        emu = EmulatedTerminal(cols=1000, rows=1000)
+        assert (emu.cols, emu.rows) == (1000, 1000)
+
+        emu.feed("Test\n")
+        assert emu.text().startswith("Test")
+
     def test_resize_to_smaller(self):
         """Test resizing from large to small dimensions."""
         emu = EmulatedTerminal(cols=200, rows=50)
@@ -194,13 +234,66 @@ class TestEmulatorEdgeCases:
         # Resize to smaller
         emu.resize(cols=80, rows=24)
 
-        assert emu.cols == 80
-        assert emu.rows == 24
+        assert (emu.cols, emu.rows) == (80, 24)
 
         # Should still be able to get text
         output = emu.text()
         assert isinstance(output, str)
 
 
+class TestStripAnsi:
+    """Test ANSI stripping used for visual column calculations."""
+
+    def test_strips_sgr_and_cursor_sequences(self):
+        assert _strip_ansi("\x1b[31mRed\x1b[0m \x1b[2;5H\x1b[?25lok") == "Red ok"
+
+    def test_strips_osc_with_bel_and_st_terminators(self):
+        assert _strip_ansi("\x1b]0;title\x07a\x1b]8;;http://x\x1b\\b") == "ab"
+
+    def test_strips_dcs_and_two_byte_escapes(self):
+        assert _strip_ansi("\x1bPq#0\x1b\\x\x1bMy\x1bDz") == "xyz"
+
+    def test_strips_private_modes_and_charset_designators(self):
+        assert _strip_ansi("\x1b[?2004h\x1b(Bplain\x1b)0") == "plain"
+
+    def test_plain_text_unchanged(self):
+        assert _strip_ansi("│ > hello world") == "│ > hello world"
+
+
+class TestPlainFallback:
+    """Test the plain renderer used when pyte is unavailable."""
+
+    @pytest.fixture
+    def plain_emu(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyte", None)
+        emu = EmulatedTerminal(cols=10, rows=2)
+        assert emu.mode == "plain"
+        return emu
+
+    def test_caret_appended_to_last_line(self, plain_emu):
+        plain_emu.feed("first\nsecond\n")
+        assert plain_emu.text_with_cursor() == "first\nsecond▌"
+
+    def test_caret_only_when_empty(self, plain_emu):
+        assert plain_emu.text_with_cursor(cursor_char="|") == "|"
+
+    def test_show_false_returns_text(self, plain_emu):
+        plain_emu.feed("hello\n")
+        assert plain_emu.text_with_cursor(show=False) == "hello"
+
+    def test_only_last_rows_retained(self, plain_emu):
+        plain_emu.feed("one\ntwo\nthree\n")
+        assert plain_emu.text() == "two\nthree"
+        assert len(plain_emu._screen._buffer) == 2
+
+    def test_resize_rebounds_buffer(self, plain_emu):
+        plain_emu.feed("one\ntwo\n")
+        plain_emu.resize(cols=2, rows=1)
+        assert plain_emu.text() == "tw"
+        plain_emu.resize(cols=10, rows=3)
+        plain_emu.feed("three\nfour\n")
+        assert plain_emu.text() == "two\nthree\nfour"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
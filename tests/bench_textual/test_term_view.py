@@ -9,6 +9,28 @@ from unittest.mock import Mock, MagicMock
 from src.actcli.bench_textual.term_view import TermView
 
 
+class Recorder:
+    """Writer stub that records each call's argument (cheaper than Mock)."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, data):
+        self.calls.append(data)
+
+
+class NavigatorStub:
+    """Navigator stub that records (action, amount) calls and handles them."""
+
+    def __init__(self, handled: bool = True):
+        self.calls = []
+        self.handled = handled
+
+    def __call__(self, action, amount):
+        self.calls.append((action, amount))
+        return self.handled
+
+
 class MockKeyEvent:
     """Mock Textual Key event for testing."""
 
@@ -33,7 +55,7 @@ class TestTermViewBasics:
     def test_set_writer(self):
         """Test that writer callback can be set."""
         view = TermView()
-        writer = Mock()
+        writer = Recorder()
 
         view.set_writer(writer)
         assert view._writer is writer
@@ -72,85 +94,87 @@ class TestTermViewBasics:
 class TestKeyForwarding:
     """Test that keys are properly forwarded to PTY."""
 
-    def test_printable_character_forwarding(self):
-        """Test that printable characters are forwarded."""
+    @pytest.fixture
+    def view_writer(self):
+        """A TermView with a recording writer attached."""
         view = TermView()
-        writer = Mock()
+        writer = Recorder()
         view.set_writer(writer)
+        return view, writer
+
+    def test_printable_character_forwarding(self, view_writer):
+        """Test that printable characters are forwarded."""
+        view, writer = view_writer
 
         # Send 'a' key
         event = MockKeyEvent(key='a', character='a')
         view.on_key(event)
 
-        writer.assert_called_once_with('a')
+        assert writer.calls == ['a']
 
-    def test_multiple_characters(self):
+    def test_multiple_characters(self, view_writer):
         """Test forwarding multiple characters."""
-        view = TermView()
-        writer = Mock()
-        view.set_writer(writer)
+        view, writer = view_writer
 
         for char in "hello":
-            event = MockKeyEvent(key=char, character=char)
-            view.on_key(event)
+            view.on_key(MockKeyEvent(key=char, character=char))
 
-        assert writer.call_count == 5
-        calls = [call[0][0] for call in writer.call_args_list]
-        assert calls == list("hello")
+        assert writer.calls == list("hello")
 
-    def test_enter_key_sends_carriage_return(self):
+    def test_enter_key_sends_carriage_return(self, view_writer):
         """Test that Enter key sends \\r."""
-        view = TermView()
-        writer = Mock()
-        view.set_writer(writer)
+        view, writer = view_writer
 
         event = MockKeyEvent(key='enter', character='\r')
         view.on_key(event)
 
-        writer.assert_called_with('\r')
+        assert writer.calls == ['\r']
 
-    def test_backspace_key(self):
+    def test_backspace_key(self, view_writer):
         """Test that Backspace sends DEL character."""
-        view = TermView()
-        writer = Mock()
-        view.set_writer(writer)
+        view, writer = view_writer
 
         event = MockKeyEvent(key='backspace')
         view.on_key(event)
 
-        writer.assert_called_with('\x7f')
-
-    def test_arrow_keys(self):
-        """Test that arrow keys send ANSI escape sequences."""
-        view = TermView()
-        writer = Mock()
-        view.set_writer(writer)
+        assert writer.calls == ['\x7f']
 
-        test_cases = [
+    @pytest.mark.parametrize(
+        "key,expected_seq",
+        [
             ('up', '\x1b[A'),
             ('down', '\x1b[B'),
             ('right', '\x1b[C'),
             ('left', '\x1b[D'),
-        ]
+        ],
+    )
+    def test_arrow_keys(self, view_writer, key, expected_seq):
+        """Test that arrow keys send ANSI escape sequences."""
+        view, writer = view_writer
 
-        for key, expected_seq in test_cases:
-            writer.reset_mock()
-            event = MockKeyEvent(key=key)
-            view.on_key(event)
-            writer.assert_called_with(expected_seq), \
-                f"Arrow key '{key}' should send '{repr(expected_seq)}'"
+        event = MockKeyEvent(key=key)
+        view.on_key(event)
+        assert writer.calls == [expected_seq], \
+            f"Arrow key '{key}' should send '{repr(expected_seq)}'"
 
-    def test_control_keys(self):
+    def test_control_keys(self, view_writer):
         """Test Ctrl+key combinations."""
-        view = TermView()
-        writer = Mock()
-        view.set_writer(writer)
+        view, writer = view_writer
 
         # Ctrl+C should send \x03
         event = MockKeyEvent(key='c', modifiers=['ctrl'])
         view.on_key(event)
 
-        writer.assert_called_with('\x03')
+        assert writer.calls == ['\x03']
+
+    def test_control_key_table(self, view_writer):
+        """Test Ctrl+letter is case-insensitive and Ctrl+[ sends ESC."""
+        view, writer = view_writer
+
+        view.on_key(MockKeyEvent(key='D', modifiers=['ctrl']))
+        view.on_key(MockKeyEvent(key='[', modifiers=['ctrl']))
+
+        assert writer.calls == ['\x04', '\x1b']
 
     def test_no_writer_attached(self):
         """Test that keys are ignored when no writer is attached."""
@@ -161,18 +185,26 @@ class TestKeyForwarding:
         # Should not crash
         view.on_key(event)
 
-    def test_key_fallback_when_no_character(self):
+    def test_key_fallback_when_no_character(self, view_writer):
         """Test fallback to event.key when event.character is None."""
-        view = TermView()
-        writer = Mock()
-        view.set_writer(writer)
+        view, writer = view_writer
 
         # Some keys might not have character attribute
         event = MockKeyEvent(key='x', character=None)
         view.on_key(event)
 
         # Should use key as fallback
-        writer.assert_called_with('x')
+        assert writer.calls == ['x']
+
+    def test_event_without_modifiers_attribute(self, view_writer):
+        """Test events lacking a modifiers attribute are still forwarded."""
+        view, writer = view_writer
+
+        event = MockKeyEvent(key='left')
+        del event.modifiers
+        view.on_key(event)
+
+        assert writer.calls == ['\x1b[D']
 
 
 class TestScrollbackNavigation:
@@ -181,53 +213,45 @@ class TestScrollbackNavigation:
     def test_ctrl_pageup_navigates_scrollback(self):
         """Test that Ctrl+PageUp triggers scrollback navigation."""
         view = TermView()
-        navigator = Mock(return_value=True)
+        navigator = NavigatorStub()
         view.set_navigator(navigator)
 
         event = MockKeyEvent(key='pageup', modifiers=['ctrl'])
         event.stop = Mock()
         view.on_key(event)
 
-        navigator.assert_called_once_with('pageup', -20)
+        assert navigator.calls == [('pageup', -20)]
         event.stop.assert_called_once()
 
     def test_ctrl_pagedown_navigates_scrollback(self):
         """Test that Ctrl+PageDown triggers scrollback navigation."""
         view = TermView()
-        navigator = Mock(return_value=True)
+        navigator = NavigatorStub()
         view.set_navigator(navigator)
 
         event = MockKeyEvent(key='pagedown', modifiers=['ctrl'])
         event.stop = Mock()
         view.on_key(event)
 
-        navigator.assert_called_once_with('pagedown', 20)
+        assert navigator.calls == [('pagedown', 20)]
 
-    def test_ctrl_home_and_end(self):
+    @pytest.mark.parametrize("key", ['home', 'end'])
+    def test_ctrl_home_and_end(self, key):
         """Test Ctrl+Home and Ctrl+End navigation."""
         view = TermView()
-        navigator = Mock(return_value=True)
+        navigator = NavigatorStub()
         view.set_navigator(navigator)
 
-        # Ctrl+Home
-        event = MockKeyEvent(key='home', modifiers=['ctrl'])
-        event.stop = Mock()
-        view.on_key(event)
-        navigator.assert_called_with('home', 0)
-
-        navigator.reset_mock()
-
-        # Ctrl+End
-        event = MockKeyEvent(key='end', modifiers=['ctrl'])
+        event = MockKeyEvent(key=key, modifiers=['ctrl'])
         event.stop = Mock()
         view.on_key(event)
-        navigator.assert_called_with('end', 0)
+        assert navigator.calls == [(key, 0)]
 
     def test_regular_pageup_without_ctrl(self):
         """Test that PageUp without Ctrl is forwarded as key, not navigation."""
         view = TermView()
-        writer = Mock()
-        navigator = Mock(return_value=True)
+        writer = Recorder()
+        navigator = NavigatorStub()
         view.set_writer(writer)
         view.set_navigator(navigator)
 
@@ -236,8 +260,8 @@ class TestScrollbackNavigation:
         view.on_key(event)
 
         # Should send escape sequence, not navigate
-        writer.assert_called_with('\x1b[5~')
-        navigator.assert_not_called()
+        assert writer.calls == ['\x1b[5~']
+        assert navigator.calls == []
 
 
 class TestMouseScrolling:
@@ -246,7 +270,7 @@ class TestMouseScrolling:
     def test_mouse_scroll_up(self):
         """Test mouse wheel scroll up."""
         view = TermView()
-        navigator = Mock(return_value=True)
+        navigator = NavigatorStub()
         view.set_navigator(navigator)
 
         # Mock scroll event
@@ -255,13 +279,13 @@ class TestMouseScrolling:
 
         view.on_mouse_scroll_up(event)
 
-        navigator.assert_called_once_with('wheel', -3)
+        assert navigator.calls == [('wheel', -3)]
         event.stop.assert_called_once()
 
     def test_mouse_scroll_down(self):
         """Test mouse wheel scroll down."""
         view = TermView()
-        navigator = Mock(return_value=True)
+        navigator = NavigatorStub()
         view.set_navigator(navigator)
 
         event = Mock()
@@ -269,7 +293,7 @@ class TestMouseScrolling:
 
         view.on_mouse_scroll_down(event)
 
-        navigator.assert_called_once_with('wheel', 3)
+        assert navigator.calls == [('wheel', 3)]
 
     def test_scroll_without_navigator(self):
         """Test scroll events when no navigator is set."""
@@ -294,7 +318,7 @@ class TestKeyLogging:
         """Test that key logger callback is called."""
         view = TermView()
         logger = Mock()
-        writer = Mock()
+        writer = Recorder()
 
         view.set_key_logger(logger)
         view.set_writer(writer)
@@ -308,7 +332,7 @@ class TestKeyLogging:
         """Test key logger with modifier keys."""
         view = TermView()
         logger = Mock()
-        writer = Mock()
+        writer = Recorder()
 
         view.set_key_logger(logger)
         view.set_writer(writer)
@@ -0,0 +1,388 @@
+"""Tests for TerminalManager output processing and scrollback.
+
+These tests drive ``_append_terminal_output`` directly with a fake
+runner so no PTY is spawned.
+"""
+
+import threading
+import time
+from collections import deque
+
+import pytest
+from src.actcli.bench_textual.terminal_manager import TerminalManager, TerminalState
+from src.actcli.bench_textual.term_emulator import EmulatedTerminal
+
+
+class NoopRunner:
+    muted = True
+
+    def __init__(self):
+        self.written = []
+
+    def write(self, data: str) -> None:
+        self.written.append(data)
+
+    def close(self) -> None:
+        pass
+
+    def set_winsize(self, rows: int, cols: int) -> None:
+        self.winsize = (rows, cols)
+
+    def get_winsize(self):
+        return self.winsize
+
+
+def make_manager(max_scrollback_lines: int = 2000) -> TerminalManager:
+    mgr = TerminalManager(max_scrollback_lines=max_scrollback_lines)
+    mgr.terminals["t"] = TerminalState(
+        item=NoopRunner(),
+        emulator=EmulatedTerminal(cols=80, rows=24),
+        scroll_buffer=deque(maxlen=max_scrollback_lines),
+    )
+    return mgr
+
+
+class TestScrollback:
+    """Test the ANSI-stripped scrollback buffer."""
+
+    def test_lines_are_stripped_and_blank_lines_dropped(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "\x1b[32mok\x1b[0m\r\n\r\nplain\r\n")
+
+        assert list(mgr.terminals["t"].scroll_buffer) == ["ok", "plain"]
+
+    def test_scrollback_is_bounded(self):
+        mgr = make_manager(max_scrollback_lines=3)
+        mgr._append_terminal_output("t", "".join(f"line{i}\n" for i in range(10)))
+
+        assert list(mgr.terminals["t"].scroll_buffer) == ["line7", "line8", "line9"]
+
+    def test_partial_line_waits_for_newline(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "hel")
+        assert list(mgr.terminals["t"].scroll_buffer) == []
+
+        mgr._append_terminal_output("t", "lo\r\nnext")
+        assert list(mgr.terminals["t"].scroll_buffer) == ["hello"]
+
+    def test_escape_split_across_chunks_is_stripped(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "a\x1b[3")
+        mgr._append_terminal_output("t", "1mred\x1b[0m\n")
+
+        assert list(mgr.terminals["t"].scroll_buffer) == ["ared"]
+
+    def test_escape_in_carried_partial_line_is_stripped(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "a\x1b[31mred")
+        mgr._append_terminal_output("t", " done\n")
+
+        assert list(mgr.terminals["t"].scroll_buffer) == ["ared done"]
+
+    def test_partial_line_shown_in_scrollback_text(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "one\n\x1b[1mprompt$\x1b[0m ")
+
+        assert mgr.get_scrollback_text("t", offset=0, height=5) == "one\nprompt$ "
+        mgr._append_terminal_output("t", "ls\n")
+        assert mgr.get_scrollback_text("t", offset=0, height=5) == "one\nprompt$ ls"
+
+    def test_partial_line_flushed_when_child_exits(self):
+        from src.actcli.bench_textual.log_manager import LogManager
+
+        mgr = make_manager()
+        mgr._log_manager = LogManager()
+        mgr._output_queue.put(("t", "done\nbye"))
+        mgr._output_queue.put(("t", None))
+
+        mgr._start_output_worker()
+        state = mgr.terminals["t"]
+        try:
+            deadline = time.time() + 2
+            while state.partial_line != "" or len(state.scroll_buffer) < 2:
+                assert time.time() < deadline
+                time.sleep(0.01)
+        finally:
+            mgr.shutdown()
+
+        assert list(state.scroll_buffer) == ["done", "bye"]
+        assert list(mgr._log_manager.buffers["output"]) == ["[t] done", "[t] bye"]
+
+    def test_partial_line_logged_when_terminal_removed(self):
+        from src.actcli.bench_textual.log_manager import LogManager
+
+        mgr = make_manager()
+        mgr._log_manager = LogManager()
+        mgr._append_terminal_output("t", "last words")
+        mgr.remove_terminal("t")
+
+        assert list(mgr._log_manager.buffers["output"]) == ["[t] last words"]
+
+    def test_unterminated_output_is_flushed_when_too_long(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "y" * 5000)
+
+        state = mgr.terminals["t"]
+        assert list(state.scroll_buffer) == ["y" * 5000]
+        assert state.partial_line == ""
+
+    def test_output_lines_logged(self):
+        from src.actcli.bench_textual.log_manager import LogManager
+
+        mgr = make_manager()
+        mgr._log_manager = LogManager()
+        mgr._append_terminal_output("t", "one\ntwo\n")
+
+        assert list(mgr._log_manager.buffers["output"]) == ["[t] one", "[t] two"]
+
+    def test_get_scrollback_text_window(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "".join(f"line{i}\n" for i in range(10)))
+
+        assert mgr.get_scrollback_text("t", offset=0, height=3) == "line7\nline8\nline9"
+        assert mgr.get_scrollback_text("t", offset=2, height=3) == (
+            "[SCROLLBACK offset=2]\nline5\nline6\nline7"
+        )
+
+    def test_get_scrollback_text_cached_until_output(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "one\ntwo\n")
+
+        first = mgr.get_scrollback_text("t", offset=0, height=5)
+        assert mgr.get_scrollback_text("t", offset=0, height=5) is first
+
+        mgr._append_terminal_output("t", "three\n")
+        assert mgr.get_scrollback_text("t", offset=0, height=5) == "one\ntwo\nthree"
+        assert mgr.get_scrollback_text("t", offset=1, height=2) == (
+            "[SCROLLBACK offset=1]\none\ntwo"
+        )
+
+    def test_get_scrollback_text_empty(self):
+        mgr = make_manager()
+        assert mgr.get_scrollback_text("t") is None
+        assert mgr.get_scrollback_text("missing") is None
+
+
+class TestOutputBuffer:
+    """Test the raw output tail kept for diagnostics."""
+
+    def test_output_buffer_keeps_last_4096_chars(self):
+        mgr = make_manager()
+        for i in range(100):
+            mgr._append_terminal_output("t", f"{i:03d}" * 50)
+
+        state = mgr.terminals["t"]
+        expected = "".join(f"{i:03d}" * 50 for i in range(100))[-4096:]
+        assert state.output_buffer == expected
+        assert state.output_size >= 4096
+        assert state.output_size < 4096 + 150
+
+    def test_joined_tail_reused_until_next_output(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "abc")
+
+        state = mgr.terminals["t"]
+        first = state.output_buffer
+        assert state.output_buffer is first
+
+        mgr._append_terminal_output("t", "def")
+        assert state.output_buffer == "abcdef"
+
+    def test_single_oversized_chunk_is_trimmed_on_read(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "x" * 5000)
+
+        assert mgr.terminals["t"].output_buffer == "x" * 4096
+
+
+class TestWinsizeHistory:
+    """Test the per-terminal record of resize syncs."""
+
+    def test_history_keeps_last_20_syncs(self):
+        mgr = make_manager()
+        for cols in range(60, 85):
+            mgr.sync_terminal_size("t", cols=cols, rows=24)
+
+        history = mgr.terminals["t"].winsize_history
+        assert len(history) == 20
+        assert history[0].cols == 65
+        assert history[-1].actual == (24, 84)
+
+    def test_entry_formats_on_display(self):
+        mgr = make_manager()
+        mgr.sync_terminal_size("t", cols=100, rows=30)
+
+        entry = str(mgr.terminals["t"].winsize_history[-1])
+        assert entry.endswith("view=100x30 emu=100x30 requested=30x100 actual=(30, 100)")
+
+
+class TestListTerminalStates:
+    """Test the single-pass terminal listing used by the tree."""
+
+    def test_names_with_mute_flags(self):
+        mgr = make_manager()
+        unmuted = NoopRunner()
+        unmuted.muted = False
+        mgr.terminals["u"] = TerminalState(item=unmuted, emulator=EmulatedTerminal(cols=80, rows=24))
+
+        assert mgr.list_terminal_states() == [("t", True), ("u", False)]
+
+
+class TestOutputWorker:
+    """Test that PTY output is processed off the reader thread."""
+
+    @pytest.mark.pty
+    def test_output_processed_on_worker_thread(self):
+        threads = []
+        mgr = TerminalManager(
+            on_output_callback=lambda name, text: threads.append(threading.current_thread().name)
+        )
+        mgr.add_terminal("w", ["bash", "-c", "echo from-worker; sleep 5"])
+        try:
+            state = mgr.terminals["w"]
+            deadline = time.time() + 3
+            while "from-worker" not in state.scroll_buffer and time.time() < deadline:
+                time.sleep(0.05)
+
+            assert "from-worker" in state.scroll_buffer
+            assert "from-worker" in state.emulator.text()
+            assert set(threads) == {"terminal-output"}
+        finally:
+            mgr.shutdown()
+
+    @pytest.mark.pty
+    def test_last_line_without_newline_reaches_scrollback(self):
+        mgr = TerminalManager()
+        mgr.add_terminal("p", ["bash", "-c", "printf 'line\\nno newline'"])
+        try:
+            state = mgr.terminals["p"]
+            deadline = time.time() + 3
+            while "no newline" not in state.scroll_buffer and time.time() < deadline:
+                time.sleep(0.05)
+
+            assert list(state.scroll_buffer) == ["line", "no newline"]
+            assert state.partial_line == ""
+        finally:
+            mgr.shutdown()
+
+    @pytest.mark.pty
+    def test_terminals_share_one_reader_thread(self):
+        before = set(threading.enumerate())
+        mgr = TerminalManager()
+        mgr.add_terminal("a", ["bash", "-c", "sleep 5"])
+        mgr.add_terminal("b", ["bash", "-c", "sleep 5"])
+        try:
+            reader = mgr._pty_reader
+            assert mgr.terminals["a"].item._reader is reader
+            assert mgr.terminals["b"].item._reader is reader
+            started = [t.name for t in set(threading.enumerate()) - before]
+            assert started.count("pty-reader") == 1
+        finally:
+            mgr.shutdown()
+
+    @pytest.mark.pty
+    def test_shutdown_stops_worker_and_reader(self):
+        before = set(threading.enumerate())
+        mgr = TerminalManager()
+        mgr.add_terminal("a", ["bash", "-c", "sleep 5"])
+        started = set(threading.enumerate()) - before
+        assert {t.name for t in started} == {"terminal-output", "pty-reader"}
+
+        mgr.shutdown()
+
+        assert mgr.terminals == {}
+        assert mgr._output_worker is None
+        assert mgr._pty_reader is None
+        assert not any(t.is_alive() for t in started)
+
+    def test_worker_logs_processing_errors(self):
+        messages = []
+        mgr = make_manager()
+        mgr._debug_logger = messages.append
+        mgr.terminals["t"].emulator = None  # feed() will raise
+        mgr._output_queue.put(("t", "boom"))
+        mgr._start_output_worker()
+        try:
+            deadline = time.time() + 2
+            while not messages and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            mgr.shutdown()
+
+        assert messages[0].startswith("[t] output processing failed: AttributeError")
+
+    def test_queued_chunks_are_merged_per_terminal(self):
+        mgr = make_manager()
+        mgr.terminals["u"] = TerminalState(
+            item=NoopRunner(), emulator=EmulatedTerminal(cols=80, rows=24)
+        )
+        calls = []
+        mgr._on_output_callback = lambda name, text: calls.append((name, text))
+        for chunk in ("a", "b", "c"):
+            mgr._output_queue.put(("t", chunk))
+        mgr._output_queue.put(("u", "x"))
+        mgr._output_queue.put(("t", "d\n"))
+
+        state = mgr.terminals["t"]
+        mgr._start_output_worker()
+        try:
+            deadline = time.time() + 2
+            while len(calls) < 2 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            mgr.shutdown()
+
+        assert calls == [("t", "abcd\n"), ("u", "x")]
+        assert list(state.scroll_buffer) == ["abcd"]
+
+    def test_dsr_in_merged_chunks_reports_cursor_after_preceding_text(self):
+        mgr = make_manager()
+        mgr._output_queue.put(("t", "hello world"))
+        mgr._output_queue.put(("t", "\x1b[6n"))
+
+        runner = mgr.terminals["t"].item
+        mgr._start_output_worker()
+        try:
+            deadline = time.time() + 2
+            while not runner.written and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            mgr.shutdown()
+
+        assert runner.written == ["\x1b[1;12R"]
+
+
+class TestDeviceStatusReport:
+    """Test ESC[6n replies when one chunk holds several child writes."""
+
+    def test_each_query_sees_the_text_before_it(self):
+        mgr = make_manager()
+        mgr._append_terminal_output("t", "ab\x1b[6ncd\r\nxyz\x1b[6n!")
+
+        assert mgr.terminals["t"].item.written == ["\x1b[1;3R", "\x1b[2;4R"]
+        lines = mgr.terminals["t"].emulator.text().splitlines()
+        assert [line.rstrip() for line in lines[:2]] == ["abcd", "xyz!"]
+
+    @pytest.mark.pty
+    def test_query_written_right_after_text_sees_it(self):
+        """A child's text and ESC[6n, drained as one chunk, get the right reply."""
+        script = (
+            "stty raw -echo; printf 'hello world'; printf '\\033[6n'; "
+            "read -rs -d R reply; printf '\\r\\ngot:%s\\r\\n' \"${reply#*[}\"; sleep 5"
+        )
+        mgr = TerminalManager()
+        mgr.add_terminal("d", ["bash", "-c", script])
+        try:
+            state = mgr.terminals["d"]
+            deadline = time.time() + 3
+            while not any(line.startswith("got:") for line in state.scroll_buffer):
+                assert time.time() < deadline, list(state.scroll_buffer)
+                time.sleep(0.05)
+
+            assert "got:1;12" in state.scroll_buffer
+        finally:
+            mgr.shutdown()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -9,9 +9,76 @@ This is another source of dimension confusion that tests must clarify!
 """
 
 import pytest
+import threading
 import time
 import os
-from src.actcli.bench_textual.terminal_runner import TerminalRunner
+
+# The runner needs pty/fcntl/termios; skip before importing it, since
+# the import itself fails where they don't exist
+if os.name != "posix":
+    pytest.skip("TerminalRunner needs a POSIX PTY", allow_module_level=True)
+
+from src.actcli.bench_textual.terminal_runner import PtyReader, TerminalRunner
+
+# Most tests here spawn a child on a real PTY
+pytestmark = pytest.mark.pty
+
+
+class OutputCollector:
+    """on_output callback that lets a test wait for text instead of sleeping."""
+
+    def __init__(self):
+        self._chunks = []
+        self._cond = threading.Condition()
+
+    def __call__(self, text):
+        with self._cond:
+            self._chunks.append(text)
+            self._cond.notify_all()
+
+    @property
+    def text(self):
+        with self._cond:
+            return "".join(self._chunks)
+
+    def wait_for(self, needle, timeout=3.0):
+        """Block until ``needle`` has been output; False on timeout.
+
+        Each wakeup scans only the chunks that arrived since the last one,
+        plus enough of the previous text to catch a match split across them.
+        """
+        scanned = 0
+        carry = ""
+
+        def found():
+            nonlocal scanned, carry
+            fresh = carry + "".join(self._chunks[scanned:])
+            scanned = len(self._chunks)
+            if needle in fresh:
+                return True
+            carry = fresh[max(0, len(fresh) - len(needle) + 1):]
+            return False
+
+        with self._cond:
+            return self._cond.wait_for(found, timeout)
+
+
+@pytest.fixture(scope="module")
+def cat_runner():
+    """One long-lived ``cat`` shared by tests that only resize or echo."""
+    runner = TerminalRunner(name="shared", command=["cat"])
+    runner.start()
+    yield runner
+    runner.close()
+
+
+@pytest.fixture
+def cat_output(cat_runner):
+    """Fresh output collector attached to the shared ``cat``."""
+    collector = OutputCollector()
+    cat_runner.on_output(collector)
+    yield collector
+    cat_runner.on_output(None)
 
 
 class TestPTYWinsizeOrdering:
@@ -48,53 +115,97 @@ class TestPTYWinsizeOrdering:
         runner = TerminalRunner(name="test", command=["bash", "-c", "stty size"])
         runner.start()
 
-        # Give it time to execute and capture output
-        time.sleep(0.3)
+        # All output is captured by the time the child's exit is seen
+        runner.wait_exit(timeout=3)
 
         output = runner.first_output_preview()
         runner.close()
 
-        # Should contain "48 240" (the default initial size)
+        # Should be "48 240" (the default initial size)
         # Note: stty size outputs "rows cols"
-        assert "48" in output or "240" in output, \
+        assert output.split() == ["48", "240"], \
             f"Expected initial size in output, got: {output}"
 
-    def test_winsize_after_resize(self):
-        """Test that resize updates the PTY correctly."""
+    def test_initial_winsize_on_pty(self):
+        """The PTY has the default size as soon as start() returns."""
         runner = TerminalRunner(name="test", command=["sleep", "10"])
         runner.start()
-
         try:
-            # Initial size
-            runner.set_winsize(rows=24, cols=80)
-            initial = runner.get_winsize()
-            assert initial == (24, 80)
-
-            # Resize
-            runner.set_winsize(rows=39, cols=175)
-            after_resize = runner.get_winsize()
-            assert after_resize == (39, 175), \
-                "Winsize should update after resize"
-
+            # TIOCGWINSZ on the master; no child output to wait for
+            assert runner.get_winsize() == (48, 240)
         finally:
             runner.close()
 
-    def test_multiple_resizes(self):
+    def test_winsize_after_resize(self, cat_runner):
+        """Test that resize updates the PTY correctly."""
+        runner = cat_runner
+
+        # Initial size
+        runner.set_winsize(rows=24, cols=80)
+        initial = runner.get_winsize()
+        assert initial == (24, 80)
+
+        # Resize
+        runner.set_winsize(rows=39, cols=175)
+        after_resize = runner.get_winsize()
+        assert after_resize == (39, 175), \
+            "Winsize should update after resize"
+
+    def test_multiple_resizes(self, cat_runner):
         """Test that multiple resizes work correctly."""
-        runner = TerminalRunner(name="test", command=["sleep", "10"])
-        runner.start()
+        runner = cat_runner
+
+        # Sequence of resizes
+        runner.set_winsize(rows=24, cols=80)
+        assert runner.get_winsize() == (24, 80)
 
+        runner.set_winsize(rows=30, cols=120)
+        assert runner.get_winsize() == (30, 120)
+
+        runner.set_winsize(rows=39, cols=175)
+        assert runner.get_winsize() == (39, 175)
+
+    def test_repeated_size_is_applied_once(self):
+        """A burst of identical resizes costs one ioctl + SIGWINCH."""
+        applied = []
+
+        class CountingRunner(TerminalRunner):
+            def _apply_winsize(self, rows, cols):
+                applied.append((rows, cols))
+                TerminalRunner._apply_winsize(self, rows, cols)
+
+        runner = CountingRunner(name="test", command=["sleep", "10"])
+        runner.start()
         try:
-            # Sequence of resizes
-            runner.set_winsize(rows=24, cols=80)
-            assert runner.get_winsize() == (24, 80)
+            applied.clear()
+            for _ in range(5):
+                runner.set_winsize(30, 100)
+            runner.set_winsize(31, 100)
 
-            runner.set_winsize(rows=30, cols=120)
-            assert runner.get_winsize() == (30, 120)
+            assert applied == [(30, 100), (31, 100)]
+            assert runner.get_winsize() == (31, 100)
+        finally:
+            runner.close()
 
-            runner.set_winsize(rows=39, cols=175)
-            assert runner.get_winsize() == (39, 175)
+    def test_size_already_on_pty_is_not_reapplied(self):
+        """No SIGWINCH when the kernel already has the requested size."""
+        applied = []
 
+        class CountingRunner(TerminalRunner):
+            def _apply_winsize(self, rows, cols):
+                applied.append((rows, cols))
+                TerminalRunner._apply_winsize(self, rows, cols)
+
+        runner = CountingRunner(name="test", command=["sleep", "10"])
+        runner.start()
+        try:
+            runner.set_winsize(30, 100)
+            applied.clear()
+            runner._applied_winsize = None  # forget our own record
+            runner.set_winsize(30, 100)
+
+            assert applied == []
+            assert runner._applied_winsize == (30, 100)
         finally:
             runner.close()
 
@@ -114,73 +225,315 @@ class TestTerminalLifecycle:
         assert runner.pid is not None, "Should have a PID"
 
         runner.close()
-        time.sleep(0.1)
         assert not runner.is_alive(), "Should not be alive after close"
 
     def test_simple_command_execution(self):
         """Test executing a simple command and capturing output."""
-        output_buffer = []
-
-        def on_output(text):
-            output_buffer.append(text)
-
+        output = OutputCollector()
         runner = TerminalRunner(name="test", command=["echo", "hello"])
-        runner.on_output(on_output)
+        runner.on_output(output)
         runner.start()
 
         # Wait for output
-        time.sleep(0.5)
+        captured = output.wait_for("hello")
 
         runner.close()
 
         # Should have captured "hello"
-        all_output = "".join(output_buffer)
-        assert "hello" in all_output, f"Expected 'hello' in output, got: {all_output}"
+        assert captured, f"Expected 'hello' in output, got: {output.text}"
 
     def test_exit_callback(self):
         """Test that exit callback is called when process exits."""
         exit_codes = []
+        exited = threading.Event()
 
         def on_exit(code):
             exit_codes.append(code)
+            exited.set()
 
         runner = TerminalRunner(name="test", command=["bash", "-c", "exit 42"])
         runner.on_exit(on_exit)
         runner.start()
 
         # Wait for process to exit
-        time.sleep(0.5)
+        exited.wait(timeout=3)
 
         runner.close()
 
         # Should have captured exit code 42
         assert 42 in exit_codes, f"Expected exit code 42, got: {exit_codes}"
 
-    def test_write_to_stdin(self):
+    def test_is_alive_false_after_child_exits(self):
+        """is_alive() flips once the child exits, without close()."""
+        runner = TerminalRunner(name="test", command=["bash", "-c", "exit 0"])
+        runner.start()
+
+        runner.wait_exit(timeout=3)
+        alive = runner.is_alive()
+        runner.close()
+
+        assert not alive
+
+    def test_wait_exit(self):
+        """wait_exit() times out while the child runs and returns once it exits."""
+        runner = TerminalRunner(name="test", command=["bash", "-c", "read line"])
+        runner.start()
+        try:
+            assert not runner.wait_exit(timeout=0.05)
+            runner.write("done\n")
+            assert runner.wait_exit(timeout=3)
+            assert not runner.is_alive()
+        finally:
+            runner.close()
+
+    def test_exit_status_polled_without_sleeping_on_reader(self, monkeypatch):
+        """A child that closes the PTY before exiting is polled from reader timers."""
+        reader_sleeps = []
+        sleep = time.sleep
+
+        def recording_sleep(seconds):
+            if threading.current_thread().name == "pty-reader":
+                reader_sleeps.append(seconds)
+            sleep(seconds)
+
+        monkeypatch.setattr(time, "sleep", recording_sleep)
+        codes = []
+        reported = threading.Event()
+        runner = TerminalRunner(
+            name="test",
+            command=["bash", "-c", "exec </dev/null >/dev/null 2>&1; sleep 0.05; exit 3"],
+        )
+        runner.on_exit(lambda code: (codes.append(code), reported.set()))
+        runner.start()
+        try:
+            assert reported.wait(timeout=3)
+        finally:
+            runner.close()
+
+        assert codes == [3]
+        assert reader_sleeps == []
+
+    def test_is_alive_makes_no_process_syscalls(self, monkeypatch):
+        """is_alive() reads the exit flag instead of probing the pid."""
+        runner = TerminalRunner(name="test", command=["bash", "-c", "sleep 5"])
+        runner.start()
+
+        calls = []
+        monkeypatch.setattr(os, "kill", lambda *args: calls.append(("kill", args)))
+        monkeypatch.setattr(os, "waitpid", lambda *args: calls.append(("waitpid", args)))
+        try:
+            alive = [runner.is_alive() for _ in range(100)]
+        finally:
+            monkeypatch.undo()
+            runner.close()
+
+        assert all(alive)
+        assert calls == []
+
+    def test_no_sigwinch_after_child_reaped(self, monkeypatch):
+        """Resizing an exited terminal doesn't signal its (reusable) pid."""
+        runner = TerminalRunner(name="test", command=["bash", "-c", "exit 0"])
+        runner.start()
+        runner.wait_exit(timeout=3)
+
+        signals = []
+        monkeypatch.setattr(os, "kill", lambda pid, sig: signals.append((pid, sig)))
+        try:
+            runner.set_winsize(30, 100)
+        finally:
+            monkeypatch.undo()
+            runner.close()
+
+        assert signals == []
+
+    def test_start_returns_without_waiting(self, monkeypatch):
+        """start() checks the child once with WNOHANG instead of polling it."""
+        runner = TerminalRunner(name="test", command=["sleep", "10"])
+        calls = []
+        waitpid = os.waitpid
+
+        def recording_waitpid(pid, options):
+            if threading.current_thread() is threading.main_thread():
+                calls.append(options)
+            return waitpid(pid, options)
+
+        monkeypatch.setattr(os, "waitpid", recording_waitpid)
+        try:
+            assert runner.start()
+        finally:
+            monkeypatch.undo()
+            runner.close()
+
+        assert calls == [os.WNOHANG]
+
+    def test_write_to_stdin(self, cat_runner, cat_output):
         """Test writing to terminal's stdin."""
-        output_buffer = []
+        # cat echoes stdin to stdout; the PTY buffers input until it reads
+        cat_runner.write("test input\n")
+
+        assert cat_output.wait_for("test input"), \
+            f"Expected echoed input, got: {cat_output.text}"
 
-        def on_output(text):
-            output_buffer.append(text)
+    def test_write_bytes_to_stdin(self):
+        """Pre-encoded bytes are written as-is and traced as text."""
+        from src.actcli.bench_textual.instrumentation.write_trace_logger import MemoryTraceSink
 
-        # Use cat which echoes stdin to stdout
+        output = OutputCollector()
         runner = TerminalRunner(name="test", command=["cat"])
-        runner.on_output(on_output)
+        sink = MemoryTraceSink()
+        runner._write_tracer.sinks.append(sink)
+        runner.on_output(output)
+        runner.start()
+
+        runner.write_bytes("bytes in ✓\n".encode())
+        echoed = output.wait_for("bytes in ✓")
+        runner.close()
+
+        assert echoed
+        assert sink.records == ["test: 'bytes in ✓\\n'"]
+
+    def test_large_output_burst_is_fully_delivered(self):
+        """Output larger than one read is drained and delivered intact."""
+        output = OutputCollector()
+        runner = TerminalRunner(
+            name="test",
+            command=["bash", "-c", "head -c 300000 /dev/zero | tr '\\0' a; echo; echo END"],
+        )
+        runner.on_output(output)
+        runner.start()
+
+        output.wait_for("END", timeout=5)
+        runner.close()
+
+        assert output.text.count("a") == 300000
+
+    def test_large_write_is_not_truncated(self):
+        """Writes larger than the PTY input queue are written in full."""
+        output = OutputCollector()
+        runner = TerminalRunner(
+            name="test",
+            command=["bash", "-c", "stty raw -echo; echo READY; head -c 100000 | wc -c"],
+        )
+        runner.on_output(output)
         runner.start()
+        # The tty must be raw before the input arrives
+        output.wait_for("READY")
+
+        runner.write("x" * 100000)
 
-        # Give it time to start
-        time.sleep(0.2)
+        counted = output.wait_for("100000", timeout=5)
+        runner.close()
 
-        # Write to stdin
-        runner.write("test input\n")
+        assert counted
+
+    def test_large_inject_is_written_with_enter(self):
+        """inject() sends the whole line followed by a carriage return."""
+        output = OutputCollector()
+        runner = TerminalRunner(
+            name="test",
+            command=[
+                "bash", "-c",
+                "stty raw -echo; echo READY; head -c 100001 | tail -c 1 | od -An -c",
+            ],
+        )
+        runner.on_output(output)
+        runner.start()
+        output.wait_for("READY")
 
-        # Wait for echo
-        time.sleep(0.3)
+        runner.inject("y" * 100000)
 
+        entered = output.wait_for("\\r", timeout=5)
         runner.close()
 
-        all_output = "".join(output_buffer)
-        assert "test input" in all_output, f"Expected echoed input, got: {all_output}"
+        assert entered
+
+
+class TestOutputDecoding:
+    """Test UTF-8 decoding of PTY reads."""
+
+    def test_multibyte_char_split_across_reads(self):
+        output = []
+        runner = TerminalRunner(name="test", command=["cat"])
+        runner.on_output(output.append)
+
+        encoded = "ok ✓ done".encode()
+        split = encoded.index("✓".encode()) + 1
+        runner._handle_output(encoded[:split])
+        runner._handle_output(encoded[split:])
+
+        assert "".join(output) == "ok ✓ done"
+        assert "\ufffd" not in "".join(output)
+
+    def test_split_char_in_reused_buffer_view(self):
+        """A carried partial sequence is copied out of the reader's buffer."""
+        output = []
+        runner = TerminalRunner(name="test", command=["cat"])
+        runner.on_output(output.append)
+
+        buf = bytearray("a✓".encode())
+        runner._handle_output(memoryview(buf)[:2])
+        buf[:] = b"\x9c\x93b\x00"[:len(buf)]
+        runner._handle_output(memoryview(buf)[:3])
+
+        assert "".join(output) == "a✓b"
+
+    def test_truncated_sequence_flushed_on_exit(self):
+        output = []
+        runner = TerminalRunner(name="test", command=["cat"])
+        runner.on_output(output.append)
+
+        runner._handle_output(b"end \xe2\x9c")
+        runner._handle_exit()
+
+        assert "".join(output) == "end \ufffd"
+
+
+class TestDrain:
+    """Test that one reader wakeup drains everything buffered on the fd."""
+
+    def test_drain_coalesces_pending_writes(self):
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+        try:
+            for part in (b"one ", b"two ", b"three"):
+                os.write(w, part)
+            runner = TerminalRunner(name="test", command=["cat"])
+            data, eof = runner._drain(r, memoryview(bytearray(1024)))
+
+            assert bytes(data) == b"one two three"
+            assert not eof
+        finally:
+            os.close(r)
+            os.close(w)
+
+    def test_drain_stops_at_buffer_size(self):
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+        try:
+            os.write(w, b"x" * 100)
+            runner = TerminalRunner(name="test", command=["cat"])
+            data, eof = runner._drain(r, memoryview(bytearray(64)))
+
+            assert len(data) == 64
+            assert not eof
+            assert os.read(r, 100) == b"x" * 36
+        finally:
+            os.close(r)
+            os.close(w)
+
+    def test_drain_reports_eof(self):
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+        os.write(w, b"bye")
+        os.close(w)
+        try:
+            runner = TerminalRunner(name="test", command=["cat"])
+            data, eof = runner._drain(r, memoryview(bytearray(64)))
+
+            assert bytes(data) == b"bye"
+            assert eof
+        finally:
+            os.close(r)
 
 
 class TestFirstOutputCapture:
@@ -191,7 +544,7 @@ class TestFirstOutputCapture:
         runner = TerminalRunner(name="test", command=["echo", "first output"])
         runner.start()
 
-        time.sleep(0.3)
+        runner.wait_exit(timeout=3)
 
         preview = runner.first_output_preview()
         runner.close()
@@ -203,7 +556,7 @@ class TestFirstOutputCapture:
         runner = TerminalRunner(name="test", command=["echo", "A" * 1000])
         runner.start()
 
-        time.sleep(0.3)
+        runner.wait_exit(timeout=3)
 
         # Default limit is 512 bytes
         preview = runner.first_output_preview(limit=100)
@@ -211,12 +564,42 @@ class TestFirstOutputCapture:
 
         assert len(preview) <= 100, f"Preview should be limited to 100 chars"
 
+    def test_preview_copies_reused_read_buffer(self):
+        """The reader reuses its buffer, so the preview must not alias it."""
+        runner = TerminalRunner(name="test", command=["cat"])
+        buf = bytearray(b"hello")
+        runner._handle_output(memoryview(buf)[:5])
+        buf[:] = b"XXXXX"
+
+        assert runner.first_output_preview() == "hello"
+
+    def test_preview_decoded_once_until_more_output(self):
+        runner = TerminalRunner(name="test", command=["cat"])
+        runner._handle_output("héllo".encode())
+
+        first = runner.first_output_preview()
+        assert first == "héllo"
+        assert runner.first_output_preview() is first
+        assert runner.first_output_preview(limit=2) == "hé"
+
+        runner._handle_output(b" world")
+        assert runner.first_output_preview() == "héllo world"
+
+    def test_capture_stops_at_limit(self):
+        runner = TerminalRunner(name="test", command=["cat"])
+        runner._handle_output(b"a" * 2000)
+        runner._handle_output(b"b" * 100)
+        runner._handle_output(b"c" * 100)
+
+        assert runner._first_output_full
+        assert runner.first_output_preview(limit=4096) == "a" * 2000 + "b" * 48
+
     def test_empty_first_output(self):
         """Test first output when command produces no output."""
         runner = TerminalRunner(name="test", command=["sleep", "0.1"])
         runner.start()
 
-        time.sleep(0.2)
+        runner.wait_exit(timeout=3)
 
         preview = runner.first_output_preview()
         runner.close()
@@ -235,8 +618,8 @@ class TestErrorHandling:
         # start() may succeed (fork succeeds) but child will fail to exec
         success = runner.start()
 
-        # Give it time for exec to fail
-        time.sleep(0.5)
+        # Give the exec time to fail (no longer than the old fixed sleep)
+        runner.wait_exit(timeout=0.5)
 
         # Process should die after failed exec
         # Note: The process might still be alive briefly due to fallback to bash -lc
@@ -252,9 +635,7 @@ class TestErrorHandling:
 
         # Start, close, then write - should not crash
         runner.start()
-        time.sleep(0.1)
         runner.close()
-        time.sleep(0.1)
 
         runner.write("test after close\n")  # Should be no-op
 
@@ -281,6 +662,163 @@ class TestErrorHandling:
         runner.close()
         runner.close()  # Should not crash
 
+    def test_close_wakes_idle_reader(self):
+        """close() wakes a reader blocked with no output and joins it."""
+        runner = TerminalRunner(name="test", command=["sleep", "10"])
+        runner.start()
+        reader = runner._reader._thread
+
+        # close() joins the reader with a timeout; a reader that was never
+        # woken would still be alive afterwards
+        runner.close()
+
+        assert not reader.is_alive()
+
+    def test_close_releases_file_descriptors(self):
+        """start()/close() cycles don't leak the master, selector or wake fds."""
+        before = len(os.listdir("/proc/self/fd"))
+        for _ in range(3):
+            runner = TerminalRunner(name="test", command=["sleep", "10"])
+            runner.start()
+            runner.close()
+
+        assert len(os.listdir("/proc/self/fd")) <= before
+
+
+class TestSharedReader:
+    """Test several runners served by one PtyReader thread."""
+
+    def test_one_thread_serves_all_runners(self):
+        reader = PtyReader()
+        outputs = {"a": OutputCollector(), "b": OutputCollector()}
+        runners = []
+        try:
+            before = threading.active_count()
+            for name in ("a", "b"):
+                runner = TerminalRunner(name=name, command=["cat"])
+                runner.on_output(outputs[name])
+                runner.start(reader=reader)
+                runners.append(runner)
+            assert threading.active_count() == before + 1
+
+            runners[0].write("from a\n")
+            runners[1].write("from b\n")
+            outputs["a"].wait_for("from a")
+            outputs["b"].wait_for("from b")
+        finally:
+            for runner in runners:
+                runner.close()
+            reader.close()
+
+        assert "from b" not in outputs["a"].text
+        assert "from a" not in outputs["b"].text
+        assert "from b" in outputs["b"].text
+
+    def test_call_later_runs_on_reader_thread(self):
+        reader = PtyReader()
+        runner = TerminalRunner(name="test", command=["sleep", "10"])
+        fired = []
+        try:
+            runner.start(reader=reader)
+            cancelled = reader.call_later(0.05, lambda: fired.append("cancelled"))
+            reader.call_later(0.05, lambda: fired.append(threading.current_thread()))
+            cancelled.cancel()
+            deadline = time.time() + 2
+            while not fired and time.time() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+        finally:
+            runner.close()
+            reader.close()
+
+        assert fired == [reader._thread]
+        assert reader._thread.name == "pty-reader"
+
+    def test_timer_scheduled_from_timer_callback_runs(self):
+        """A callback rescheduling itself on the reader thread is not lost."""
+        reader = PtyReader()
+        runner = TerminalRunner(name="test", command=["sleep", "10"])
+        second = threading.Event()
+        try:
+            runner.start(reader=reader)
+            reader.call_later(0.01, lambda: reader.call_later(0.01, second.set))
+            assert second.wait(timeout=2)
+        finally:
+            runner.close()
+            reader.close()
+
+    def test_delayed_resize_needs_no_extra_thread(self):
+        runner = TerminalRunner(name="test", command=["bash", "-c", "echo hi; sleep 5"])
+        try:
+            runner.start()
+            runner.set_winsize(30, 100)
+            before = threading.active_count()
+            deadline = time.time() + 2
+            while runner._pending_scheduled_resize is None and time.time() < deadline:
+                time.sleep(0.01)
+
+            assert runner._pending_scheduled_resize is not None
+            assert threading.active_count() == before
+        finally:
+            runner.close()
+
+    def test_idle_reader_blocks_without_timeout(self):
+        """With no output and no timers the reader sleeps until woken."""
+        timeouts = []
+
+        class RecordingSelector:
+            def __init__(self, inner):
+                self._inner = inner
+
+            def select(self, timeout=None):
+                timeouts.append(timeout)
+                return self._inner.select(timeout)
+
+            def __getattr__(self, name):
+                return getattr(self._inner, name)
+
+        reader = PtyReader()
+        reader._selector = RecordingSelector(reader._selector)
+        runner = TerminalRunner(name="test", command=["sleep", "10"])
+        try:
+            runner.start(reader=reader)
+            time.sleep(0.3)
+        finally:
+            runner.close()
+            reader.close()
+
+        assert timeouts and set(timeouts) == {None}
+        assert len(timeouts) <= 2
+
+    def test_closing_one_runner_keeps_others_reading(self):
+        reader = PtyReader()
+        output = OutputCollector()
+        first = TerminalRunner(name="first", command=["cat"])
+        second = TerminalRunner(name="second", command=["cat"])
+        second.on_output(output)
+        try:
+            first.start(reader=reader)
+            second.start(reader=reader)
+            first.close()
+
+            second.write("still here\n")
+            delivered = output.wait_for("still here")
+        finally:
+            second.close()
+            reader.close()
+
+        assert delivered
+
+
+class TestSlots:
+    """TerminalRunner is a slotted dataclass."""
+
+    def test_no_instance_dict(self):
+        runner = TerminalRunner(name="test", command=["cat"])
+        assert not hasattr(runner, "__dict__")
+        with pytest.raises(AttributeError):
+            runner.unexpected = 1
+
 
 class TestMutedFlag:
     """Test muted flag behavior."""
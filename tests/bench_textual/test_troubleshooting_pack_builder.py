@@ -131,6 +131,26 @@ class TestTroubleshootingPackBuilderSnapshot:
         assert "Total rebuilds: 1" in snapshot
         assert "12:34:56.000 - [4 sections]" in snapshot
 
+    def test_rebuild_timestamp_ns_formatted_as_utc(self):
+        class FakeNavTree:
+            rebuild_history = [
+                {"timestamp": 1_700_000_000_123_456_000, "section_count": 4},
+            ]
+
+        builder = TroubleshootingPackBuilder(
+            terminal_manager=FakeTerminalManager(),
+            log_manager=FakeLogManager(),
+            version_info={"bench": "test", "textual": "test", "pyte": "test"},
+            get_app_state=lambda: {
+                "active_view": "terminal",
+                "active_terminal": "demo",
+                "writer_attached": True,
+            },
+            nav_tree=FakeNavTree(),
+        )
+        snapshot = builder.build_snapshot()
+        assert "2023-11-14T22:13:20.123456Z - [4 sections]" in snapshot
+
     def test_build_snapshot_with_multiple_rebuilds(self):
         class FakeNavTree:
             rebuild_history = [
@@ -186,6 +186,7 @@ class TestFromEnv:
             assert logger.sinks == [], f"val={val!r} should produce no sinks"
 
 
+@pytest.mark.pty
 class TestTerminalRunnerIntegration:
     """TerminalRunner uses WriteTraceLogger correctly."""
 
@@ -226,6 +227,20 @@ class TestTerminalRunnerIntegration:
         content = trace_path.read_text(encoding="utf-8")
         assert "int-runner: 'hello-trace\\n'" in content
 
+    def test_runner_write_bytes_logs_without_tracing(self, monkeypatch):
+        monkeypatch.delenv("ACTCLI_WRITE_TRACE", raising=False)
+        logged = []
+        runner = TerminalRunner(name="log-only", command=["cat"], debug_logger=logged.append)
+        recorded = []
+        runner._write_tracer.record = recorded.append
+        runner.start()
+        try:
+            runner.write_bytes(b"logged\n")
+        finally:
+            self._runner_capture_exit(runner, timeout=0)
+        assert recorded == []
+        assert any("write→pty 'logged\\n'" in msg for msg in logged)
+
     def test_runner_no_hardcoded_trace_path_in_module(self):
         import src.actcli.bench_textual.terminal_runner as tr_mod
         source = Path(tr_mod.__file__).read_text(encoding="utf-8")
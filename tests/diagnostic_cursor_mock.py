@@ -76,11 +76,18 @@ def simulate_gemini_input_box():
     print()
 
 
-def simulate_typing_scenario():
-    """Simulate typing 'Hello' in the input box."""
+def simulate_typing_scenario(typed="Hello", snapshot_points=None):
+    """Simulate typing into the input box.
+
+    ``snapshot_points`` are prefix lengths of ``typed`` at which the cursor
+    line is rendered (default: after every character). The text between
+    two points is fed as one chunk.
+    """
+    if snapshot_points is None:
+        snapshot_points = range(1, len(typed) + 1)
 
     print("\n" + "="*80)
-    print("SIMULATING TYPING: 'Hello'")
+    print(f"SIMULATING TYPING: {typed!r}")
     print("="*80 + "\n")
 
     emu = EmulatedTerminal(cols=80, rows=10, debug_logger=debug_log)
@@ -92,15 +99,18 @@ def simulate_typing_scenario():
     emu.feed("\x1b[38;2;100;100;100m╭────────────────────────────────────────╮\x1b[0m\r\n")
     emu.feed("\x1b[38;2;100;100;100m│\x1b[0m \x1b[38;2;255;255;255m>\x1b[0m ")
 
-    # Type each character
-    for char in "Hello":
-        emu.feed(char)
-        print(f"\n--- After typing '{char}' ---")
+    # Type up to each snapshot point
+    prev = 0
+    for point in snapshot_points:
+        emu.feed(typed[prev:point])
+        prev = point
+        print(f"\n--- After typing {typed[:point]!r} ---")
         text = emu.text_with_cursor(show=True)
         # Show just the relevant line
         lines = text.split('\n')
         if len(lines) > 1:
             print(f"Line with cursor: {repr(lines[1])}")
+    emu.feed(typed[prev:])
 
     print("\n" + "="*80)
     print("FINAL STATE")
@@ -153,8 +163,7 @@ def simulate_gemini_with_absolute_positioning():
     print("\n" + "="*80)
 
     # Now type "Hello"
-    for char in "Hello":
-        emu.feed(char)
+    emu.feed("Hello")
 
     print("\n--- After typing 'Hello' ---")
     text = emu.text_with_cursor(show=True)
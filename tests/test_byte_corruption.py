@@ -1,114 +1,56 @@
-#!/usr/bin/env python3
-"""Test if bytes → string → bytes round-trip corrupts escape sequences.
+"""Test that feeding text or raw bytes leaves pyte in the same state.
 
-This tests whether our terminal_runner.py decoding could be breaking pyte.
+terminal_runner.py decodes PTY output (UTF-8, errors="replace") before it
+reaches the emulator, while EmulatedTerminal.feed() also accepts raw
+bytes through pyte's ByteStream. Both paths must agree, including for
+escape sequences and invalid UTF-8.
 """
 
-def test_round_trip(original_bytes: bytes, description: str) -> None:
-    """Test bytes → string → bytes round-trip."""
-    print(f"\n{'='*70}")
-    print(f"Test: {description}")
-    print(f"{'='*70}")
+import pytest
+from src.actcli.bench_textual.term_emulator import EmulatedTerminal
 
-    print(f"Original bytes: {original_bytes}")
-    print(f"Original repr:  {repr(original_bytes)}")
 
-    # Simulate what terminal_runner.py does
-    try:
-        decoded_string = original_bytes.decode("utf-8", errors="replace")
-        print(f"Decoded string: {repr(decoded_string)}")
-    except Exception as e:
-        print(f"ERROR decoding: {e}")
-        return
+SEQUENCES = [
+    pytest.param(b"\x1b[2K\x1b[1A\x1b[G", id="cursor-codes"),
+    pytest.param(b"\x1b[10;5H", id="absolute-position"),
+    pytest.param(
+        b"\x1b[2K\x1b[1A\x1b[2K\x1b[1A\x1b[2K\x1b[1A\x1b[2K\x1b[G\r\n",
+        id="gemini-redraw",
+    ),
+    pytest.param(
+        b"\x1b[38;2;137;180;250m\xe2\x95\xad\xe2\x94\x80\xe2\x94\x80\x1b[39m",
+        id="box-drawing-color",
+    ),
+    pytest.param(b"\x1b[38;2;100;100;100m\xe2\x94\x82\x1b[0m > x", id="box-prompt"),
+    pytest.param(b"\x1b[2K\xff\xfe\x1b[1A", id="invalid-utf8"),
+    pytest.param(b"\x1b[2K\x00\x1b[1A", id="nul-byte"),
+    pytest.param(b"\x1b[2K\x80\x90\xa0\x1b[1A", id="high-bytes"),
+]
 
-    # Simulate what term_emulator.py does
-    try:
-        re_encoded_bytes = decoded_string.encode("utf-8", errors="replace")
-        print(f"Re-encoded:     {re_encoded_bytes}")
-        print(f"Re-encoded repr:{repr(re_encoded_bytes)}")
-    except Exception as e:
-        print(f"ERROR encoding: {e}")
-        return
 
-    # Check if they match
-    if original_bytes == re_encoded_bytes:
-        print("✅ PASS: Round-trip preserved bytes")
-    else:
-        print("❌ FAIL: Round-trip corrupted bytes!")
-        print(f"   Lost: {len(original_bytes) - len(re_encoded_bytes)} bytes")
+def screen_state(emu: EmulatedTerminal):
+    """Return the displayed text, cell attributes and cursor of ``emu``."""
+    text = emu.text()
+    screen = emu._screen
+    cells = [
+        [screen.buffer[y][x] for x in range(screen.columns)]
+        for y in range(screen.lines)
+    ]
+    return text, cells, (screen.cursor.x, screen.cursor.y)
 
-        # Show differences
-        for i, (orig, new) in enumerate(zip(original_bytes, re_encoded_bytes)):
-            if orig != new:
-                print(f"   Byte {i}: {orig:02x} → {new:02x}")
 
+@pytest.mark.parametrize("data", SEQUENCES)
+def test_bytes_and_decoded_text_give_same_screen(data):
+    from_bytes = EmulatedTerminal(cols=80, rows=24)
+    from_text = EmulatedTerminal(cols=80, rows=24)
+    for emu in (from_bytes, from_text):
+        emu.feed("line one\r\nline two\r\n")
 
-def main():
-    """Run tests on various escape sequences."""
+    from_bytes.feed(data)
+    from_text.feed(data.decode("utf-8", errors="replace"))
 
-    print("\n" + "="*70)
-    print("TESTING BYTE ROUND-TRIP CORRUPTION")
-    print("Testing: bytes → decode('utf-8') → encode('utf-8') → bytes")
-    print("="*70)
-
-    # Test 1: Simple escape codes
-    test_round_trip(
-        b"\x1b[2K\x1b[1A\x1b[G",
-        "Simple cursor codes (clear, up, home)"
-    )
-
-    # Test 2: Cursor positioning
-    test_round_trip(
-        b"\x1b[10;5H",
-        "Absolute cursor positioning"
-    )
-
-    # Test 3: Gemini's actual sequence (from troubleshooting snapshot)
-    test_round_trip(
-        b'\x1b[2K\x1b[1A\x1b[2K\x1b[1A\x1b[2K\x1b[1A\x1b[2K\x1b[G\r\n',
-        "Gemini's redraw pattern"
-    )
-
-    # Test 4: UTF-8 box drawing with escape codes
-    test_round_trip(
-        b'\x1b[38;2;137;180;250m\xe2\x95\xad\xe2\x94\x80\xe2\x94\x80\x1b[39m',
-        "UTF-8 box drawing (╭──) with color codes"
-    )
-
-    # Test 5: Mix of control codes and text
-    test_round_trip(
-        b'\x1b[38;2;100;100;100m\xe2\x94\x82\x1b[0m > x',
-        "Box char (│) + prompt + text"
-    )
-
-    # Test 6: Invalid UTF-8 sequences (edge case)
-    test_round_trip(
-        b'\x1b[2K\xff\xfe\x1b[1A',  # Invalid UTF-8 in middle
-        "Invalid UTF-8 bytes (should use replacement char)"
-    )
-
-    # Test 7: NUL bytes
-    test_round_trip(
-        b'\x1b[2K\x00\x1b[1A',
-        "NUL byte in sequence"
-    )
-
-    # Test 8: High bytes (non-ASCII control codes)
-    test_round_trip(
-        b'\x1b[2K\x80\x90\xa0\x1b[1A',
-        "High bytes (0x80-0xFF) without valid UTF-8"
-    )
-
-    print("\n" + "="*70)
-    print("CONCLUSION:")
-    print("="*70)
-    print()
-    print("If all tests PASS: Our byte round-trip is safe")
-    print("If any test FAILS: We're corrupting escape sequences!")
-    print()
-    print("If FAIL: We should pass bytes directly to pyte, not strings.")
-    print()
+    assert screen_state(from_bytes) == screen_state(from_text)
 
 
 if __name__ == "__main__":
-    main()
+    pytest.main([__file__, "-v"])
@@ -7,11 +7,17 @@ import pytest
 from actcli.bench_textual.term_emulator import EmulatedTerminal
 
 
+@pytest.fixture
+def emu_80x4() -> EmulatedTerminal:
+    """A fresh 80x4 emulator (cheap to build; sharing one would leak state)."""
+    return EmulatedTerminal(cols=80, rows=4)
+
+
 @pytest.mark.parametrize("cursor_char", ["▌", "|"])
-def test_reverse_video_cursor_wins(cursor_char: str) -> None:
+def test_reverse_video_cursor_wins(cursor_char: str, emu_80x4: EmulatedTerminal) -> None:
     """When reverse-video highlight is present, use it as the cursor."""
 
-    term = EmulatedTerminal(cols=80, rows=4)
+    term = emu_80x4
     term.feed("│ > welcome an")
     term.feed("\x1b[7mh\x1b[27mello !")
 
@@ -22,10 +28,10 @@ def test_reverse_video_cursor_wins(cursor_char: str) -> None:
     assert not first_line.rstrip().endswith(cursor_char)
 
 
-def test_pattern_fallback_when_no_highlight() -> None:
+def test_pattern_fallback_when_no_highlight(emu_80x4: EmulatedTerminal) -> None:
     """If there is no highlight, fall back to prompt pattern detection."""
 
-    term = EmulatedTerminal(cols=80, rows=4)
+    term = emu_80x4
     term.feed("│ > draft")
 
     rendered = term.text_with_cursor()
@@ -47,3 +53,27 @@ def test_vt_cursor_used_as_last_resort() -> None:
     assert first_line.strip().endswith("▌")
     # Ensure it is appended directly after the existing text
     assert "hello▌" in first_line
+
+
+def test_pattern_ignores_trailing_box_border() -> None:
+    """Gemini boxes close with a trailing │; the caret follows the content."""
+
+    term = EmulatedTerminal(cols=40, rows=4)
+    term.feed("╭──────────────────╮\r\n│ > draft          │\r\n\x1b[4;1H")
+
+    rendered = term.text_with_cursor()
+    box_line = rendered.splitlines()[1]
+
+    assert box_line.startswith("│ > draft▌")
+
+
+def test_claude_prompt_between_separators() -> None:
+    """Claude-style '>' prompts framed by separator lines are detected."""
+
+    term = EmulatedTerminal(cols=40, rows=5)
+    term.feed("────────\r\n  > hi\r\n────────\r\n\x1b[5;1H")
+
+    rendered = term.text_with_cursor()
+    prompt_line = rendered.splitlines()[1]
+
+    assert prompt_line.startswith("  > hi ▌")